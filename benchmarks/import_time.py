@@ -0,0 +1,68 @@
+# 2024 skunkworxdark (https://github.com/skunkworxdark)
+"""Measures how long the collection_tools node pack takes to import and how many nodes it registers.
+
+Run it with the python of an InvokeAI install, from anywhere:
+
+    python benchmarks/import_time.py --repeat 5 --max-ms 500
+
+Add --stub to run it against the local stand-in of the InvokeAI API (benchmarks/invokeai_stub) instead.
+
+Each run imports the pack in a fresh interpreter after InvokeAI itself is imported, so only the cost of
+building and registering this pack's nodes is measured. With --max-ms the script exits with an error if
+the median import time is over the budget.
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+PACKAGE_DIR = Path(__file__).resolve().parents[1]
+STUB_DIR = PACKAGE_DIR / "benchmarks" / "invokeai_stub"
+
+_MEASURE = """
+import importlib, json, sys, time
+sys.path[:0] = {stub_path!r}
+import invokeai.invocation_api  # exclude InvokeAI's own import time
+sys.path.insert(0, {parent!r})
+start = time.perf_counter()
+module = importlib.import_module({package!r} + ".collection_tools")
+elapsed_ms = (time.perf_counter() - start) * 1000
+typed_nodes = sum(len(nodes) for nodes in module.TYPED_COLLECTION_NODES.values())
+print(json.dumps({{"ms": elapsed_ms, "types": len(module.TYPED_COLLECTION_TYPES), "typed_nodes": typed_nodes}}))
+"""
+
+
+def measure_once(use_stub: bool = False) -> dict:
+    """Imports the node pack in a fresh interpreter and returns the timing and node counts."""
+
+    stub_path = [str(STUB_DIR)] if use_stub else []
+    code = _MEASURE.format(parent=str(PACKAGE_DIR.parent), package=PACKAGE_DIR.name, stub_path=stub_path)
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5, help="number of fresh interpreter imports to time")
+    parser.add_argument("--max-ms", type=float, default=None, help="fail if the median import time is above this")
+    parser.add_argument("--stub", action="store_true", help="use the local stand-in of the InvokeAI API")
+    args = parser.parse_args()
+
+    runs = [measure_once(args.stub) for _ in range(args.repeat)]
+    median_ms = statistics.median(run["ms"] for run in runs)
+    print(
+        f"collection_tools import: median {median_ms:.1f} ms over {len(runs)} runs "
+        f"(min {min(run['ms'] for run in runs):.1f} ms), "
+        f"{runs[0]['typed_nodes']} typed nodes from {runs[0]['types']} collection types"
+    )
+    if args.max_ms is not None and median_ms > args.max_ms:
+        print(f"import time {median_ms:.1f} ms is over the {args.max_ms:.1f} ms budget", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
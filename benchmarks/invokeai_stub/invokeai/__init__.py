@@ -0,0 +1,6 @@
+"""A lightweight local stand-in for the parts of the InvokeAI invocation API used by collection_tools.
+
+It mirrors the public names and the registration checks of the real decorators (unique invocation types, semver
+versions, InputField/OutputField only fields and an output annotation on invoke) and provides an InvocationContext
+backed by in-memory image and tensor stores, so the nodes can be run and timed without an InvokeAI install.
+"""
@@ -0,0 +1,121 @@
+"""Minimal stand-in for invokeai.app.invocations.baseinvocation."""
+
+import re
+from abc import ABC, abstractmethod
+from inspect import signature
+from types import SimpleNamespace
+from typing import Any, Callable, ClassVar, Literal, Optional, TypeVar
+from uuid import uuid4
+
+from pydantic import BaseModel, ConfigDict, Field, create_model
+
+_INVOCATIONS: dict[str, type["BaseInvocation"]] = {}
+_OUTPUTS: dict[str, type["BaseInvocationOutput"]] = {}
+_RESERVED_INPUTS = {"id", "is_intermediate", "use_cache", "type"}
+_SEMVER = re.compile(r"^\d+\.\d+\.\d+$")
+
+
+class BaseInvocationOutput(BaseModel):
+    """Base class for all invocation outputs."""
+
+    model_config = ConfigDict(validate_assignment=True)
+
+
+class BaseInvocation(ABC, BaseModel):
+    """Base class for all invocations."""
+
+    model_config = ConfigDict(validate_assignment=True, arbitrary_types_allowed=True)
+
+    id: str = Field(default_factory=lambda: str(uuid4()), json_schema_extra={"field_kind": "node_attribute"})
+    is_intermediate: bool = Field(default=False, json_schema_extra={"field_kind": "node_attribute"})
+    use_cache: bool = Field(default=True, json_schema_extra={"field_kind": "node_attribute"})
+
+    UIConfig: ClassVar[SimpleNamespace]
+
+    @abstractmethod
+    def invoke(self, context: Any) -> BaseInvocationOutput:
+        """Invoke with provided context and return outputs."""
+
+    @classmethod
+    def get_invocation_types(cls) -> list[str]:
+        return list(_INVOCATIONS)
+
+    @classmethod
+    def get_invocation(cls, invocation_type: str) -> type["BaseInvocation"]:
+        return _INVOCATIONS[invocation_type]
+
+
+TInvocation = TypeVar("TInvocation", bound=BaseInvocation)
+TOutput = TypeVar("TOutput", bound=BaseInvocationOutput)
+
+
+def _validate_fields(cls: type[BaseModel], kind: str, type_name: str) -> None:
+    for name, field_info in cls.model_fields.items():
+        if name in _RESERVED_INPUTS:
+            continue
+        extra = field_info.json_schema_extra if isinstance(field_info.json_schema_extra, dict) else {}
+        if extra.get("field_kind") != kind:
+            raise ValueError(f"{type_name}.{name}: fields must be created with {kind.capitalize()}Field")
+
+
+def invocation(
+    invocation_type: str,
+    title: Optional[str] = None,
+    tags: Optional[list[str]] = None,
+    category: Optional[str] = None,
+    version: Optional[str] = None,
+    use_cache: Optional[bool] = True,
+    classification: Any = None,
+) -> Callable[[type[TInvocation]], type[TInvocation]]:
+    """Registers an invocation, applying the same checks as InvokeAI."""
+
+    def wrapper(cls: type[TInvocation]) -> type[TInvocation]:
+        if re.compile(r"^\S+$").match(invocation_type) is None:
+            raise ValueError(f'"invocation_type" must consist of non-whitespace characters, got "{invocation_type}"')
+        if invocation_type in _INVOCATIONS:
+            raise ValueError(f'Invocation type "{invocation_type}" already exists')
+        if version is not None and not _SEMVER.match(version):
+            raise ValueError(f'Invalid version "{version}" for "{invocation_type}"')
+        if "invoke" in getattr(cls, "__abstractmethods__", ()):
+            raise ValueError(f'Invocation "{invocation_type}" must implement the "invoke" method')
+        output = signature(cls.invoke).return_annotation
+        if not (isinstance(output, type) and issubclass(output, BaseInvocationOutput)):
+            raise ValueError(f'Invocation "{invocation_type}" invoke() must be annotated with an output class')
+        _validate_fields(cls, "input", invocation_type)
+
+        new_class = create_model(
+            cls.__qualname__,
+            __base__=cls,
+            __module__=cls.__module__,
+            type=(Literal[invocation_type], Field(title="type", default=invocation_type)),
+        )
+        new_class.__doc__ = cls.__doc__
+        new_class.UIConfig = SimpleNamespace(
+            title=title, tags=tags, category=category, version=version or "1.0.0", use_cache=use_cache
+        )
+        if use_cache is not None:
+            new_class.model_fields["use_cache"].default = use_cache
+        _INVOCATIONS[invocation_type] = new_class
+        return new_class
+
+    return wrapper
+
+
+def invocation_output(output_type: str) -> Callable[[type[TOutput]], type[TOutput]]:
+    """Registers an invocation output, applying the same checks as InvokeAI."""
+
+    def wrapper(cls: type[TOutput]) -> type[TOutput]:
+        if output_type in _OUTPUTS:
+            raise ValueError(f'Invocation output type "{output_type}" already exists')
+        _validate_fields(cls, "output", output_type)
+        new_class = create_model(
+            cls.__qualname__,
+            __base__=cls,
+            __module__=cls.__module__,
+            type=(Literal[output_type], Field(title="type", default=output_type)),
+        )
+        new_class.__doc__ = cls.__doc__
+        _OUTPUTS[output_type] = new_class
+        return new_class
+
+    return wrapper
@@ -0,0 +1,99 @@
+"""Minimal stand-in for invokeai.app.invocations.fields."""
+
+from enum import Enum
+from typing import Any, Optional
+
+from pydantic import BaseModel, Field
+from pydantic_core import PydanticUndefined
+
+
+class Input(str, Enum):
+    Connection = "connection"
+    Direct = "direct"
+    Any = "any"
+
+
+class UIType(str, Enum):
+    _Collection = "CollectionField"
+    _CollectionItem = "CollectionItemField"
+
+
+class UIComponent(str, Enum):
+    none = "none"
+    Textarea = "textarea"
+    Slider = "slider"
+
+
+class FieldDescriptions:
+    cond = "Conditioning tensor"
+    control = "ControlNet(s) to apply"
+    lora_model = "LoRA model to load"
+    lora_weight = "The weight at which the LoRA is applied to each model"
+    seed = "Seed for random number generation"
+
+
+def InputField(
+    default: Any = PydanticUndefined,
+    *,
+    description: Optional[str] = None,
+    title: Optional[str] = None,
+    input: Input = Input.Any,
+    ui_type: Optional[UIType] = None,
+    ui_component: Optional[UIComponent] = None,
+    ui_hidden: bool = False,
+    ui_order: Optional[int] = None,
+    **kwargs: Any,
+) -> Any:
+    extra = {"field_kind": "input", "input": input, "ui_hidden": ui_hidden}
+    if ui_type is not None:
+        extra["ui_type"] = ui_type
+    if ui_component is not None:
+        extra["ui_component"] = ui_component
+    if ui_order is not None:
+        extra["ui_order"] = ui_order
+    return Field(default=default, description=description, title=title, json_schema_extra=extra, **kwargs)
+
+
+def OutputField(
+    default: Any = PydanticUndefined,
+    *,
+    description: Optional[str] = None,
+    title: Optional[str] = None,
+    ui_type: Optional[UIType] = None,
+    ui_hidden: bool = False,
+    ui_order: Optional[int] = None,
+) -> Any:
+    extra: dict[str, Any] = {"field_kind": "output", "ui_hidden": ui_hidden}
+    if ui_type is not None:
+        extra["ui_type"] = ui_type
+    if ui_order is not None:
+        extra["ui_order"] = ui_order
+    return Field(default=default, description=description, title=title, json_schema_extra=extra)
+
+
+class ImageField(BaseModel):
+    image_name: str = Field(description="The name of the image")
+
+
+class LatentsField(BaseModel):
+    latents_name: str = Field(description="The name of the latents")
+    seed: Optional[int] = Field(default=None, description="Seed used to generate this latents")
+
+
+class TensorField(BaseModel):
+    tensor_name: str = Field(description="The name of a tensor.")
+
+
+class ConditioningField(BaseModel):
+    conditioning_name: str = Field(description="The name of conditioning tensor")
+    mask: Optional[TensorField] = Field(default=None, description="The mask associated with this conditioning tensor.")
+
+
+class FluxConditioningField(BaseModel):
+    conditioning_name: str = Field(description="The name of conditioning tensor")
+    mask: Optional[TensorField] = Field(default=None, description="The mask associated with this conditioning tensor.")
+
+
+class FluxReduxConditioningField(BaseModel):
+    conditioning: TensorField = Field(description="The Redux image conditioning tensor.")
+    mask: Optional[TensorField] = Field(default=None, description="The mask associated with this conditioning tensor.")
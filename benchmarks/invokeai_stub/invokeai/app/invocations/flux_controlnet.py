@@ -0,0 +1,20 @@
+"""Minimal stand-in for invokeai.app.invocations.flux_controlnet."""
+
+from pydantic import BaseModel, Field
+
+from invokeai.app.invocations.baseinvocation import BaseInvocationOutput, invocation_output
+from invokeai.app.invocations.fields import FieldDescriptions, ImageField, OutputField
+from invokeai.app.invocations.model import ModelIdentifierField
+
+
+class FluxControlNetField(BaseModel):
+    image: ImageField = Field(description="The control image")
+    control_model: ModelIdentifierField = Field(description="The ControlNet model to use")
+    control_weight: float = Field(default=1, description="The weight given to the ControlNet")
+    begin_step_percent: float = Field(default=0)
+    end_step_percent: float = Field(default=1)
+
+
+@invocation_output("flux_controlnet_output")
+class FluxControlNetOutput(BaseInvocationOutput):
+    control: FluxControlNetField = OutputField(description=FieldDescriptions.control)
@@ -0,0 +1,9 @@
+"""Minimal stand-in for invokeai.app.invocations.flux_redux."""
+
+from invokeai.app.invocations.baseinvocation import BaseInvocationOutput, invocation_output
+from invokeai.app.invocations.fields import FluxReduxConditioningField, OutputField
+
+
+@invocation_output("flux_redux_output")
+class FluxReduxOutput(BaseInvocationOutput):
+    redux_cond: FluxReduxConditioningField = OutputField(description="FLUX Redux conditioning tensor")
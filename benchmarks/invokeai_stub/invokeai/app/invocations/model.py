@@ -0,0 +1,16 @@
+"""Minimal stand-in for invokeai.app.invocations.model."""
+
+from pydantic import BaseModel, Field
+
+
+class ModelIdentifierField(BaseModel):
+    key: str = Field(description="The model's unique key")
+    hash: str = Field(default="", description="The model's BLAKE3 hash")
+    name: str = Field(default="", description="The model's name")
+    base: str = Field(default="any", description="The model's base model type")
+    type: str = Field(default="lora", description="The model's type")
+
+
+class LoRAField(BaseModel):
+    lora: ModelIdentifierField = Field(description="Info to load lora model")
+    weight: float = Field(description="Weight to apply to lora model")
@@ -0,0 +1,188 @@
+"""Minimal stand-in for invokeai.app.invocations.primitives."""
+
+from typing import Any, Optional
+
+from invokeai.app.invocations.baseinvocation import (
+    BaseInvocation,
+    BaseInvocationOutput,
+    invocation,
+    invocation_output,
+)
+from invokeai.app.invocations.fields import (
+    ConditioningField,
+    FieldDescriptions,
+    FluxConditioningField,
+    ImageField,
+    InputField,
+    LatentsField,
+    OutputField,
+)
+from invokeai.app.services.shared.invocation_context import InvocationContext
+
+LATENT_SCALE_FACTOR = 8
+
+
+@invocation_output("boolean_output")
+class BooleanOutput(BaseInvocationOutput):
+    value: bool = OutputField(description="The output boolean")
+
+
+@invocation_output("boolean_collection_output")
+class BooleanCollectionOutput(BaseInvocationOutput):
+    collection: list[bool] = OutputField(description="The output boolean collection")
+
+
+@invocation_output("integer_output")
+class IntegerOutput(BaseInvocationOutput):
+    value: int = OutputField(description="The output integer")
+
+
+@invocation_output("integer_collection_output")
+class IntegerCollectionOutput(BaseInvocationOutput):
+    collection: list[int] = OutputField(description="The int collection")
+
+
+@invocation_output("float_output")
+class FloatOutput(BaseInvocationOutput):
+    value: float = OutputField(description="The output float")
+
+
+@invocation_output("float_collection_output")
+class FloatCollectionOutput(BaseInvocationOutput):
+    collection: list[float] = OutputField(description="The float collection")
+
+
+@invocation_output("string_output")
+class StringOutput(BaseInvocationOutput):
+    value: str = OutputField(description="The output string")
+
+
+@invocation_output("string_collection_output")
+class StringCollectionOutput(BaseInvocationOutput):
+    collection: list[str] = OutputField(description="The output strings")
+
+
+@invocation_output("image_output")
+class ImageOutput(BaseInvocationOutput):
+    image: ImageField = OutputField(description="The output image")
+    width: int = OutputField(description="The width of the image in pixels")
+    height: int = OutputField(description="The height of the image in pixels")
+
+    @classmethod
+    def build(cls, image_dto: Any) -> "ImageOutput":
+        return cls(image=ImageField(image_name=image_dto.image_name), width=image_dto.width, height=image_dto.height)
+
+
+@invocation_output("image_collection_output")
+class ImageCollectionOutput(BaseInvocationOutput):
+    collection: list[ImageField] = OutputField(description="The output images")
+
+
+@invocation_output("latents_output")
+class LatentsOutput(BaseInvocationOutput):
+    latents: LatentsField = OutputField(description="Latents tensor")
+    width: int = OutputField(description="Width of output (px)")
+    height: int = OutputField(description="Height of output (px)")
+
+    @classmethod
+    def build(cls, latents_name: str, latents: Any, seed: Optional[int] = None) -> "LatentsOutput":
+        return cls(
+            latents=LatentsField(latents_name=latents_name, seed=seed),
+            width=latents.shape[-1] * LATENT_SCALE_FACTOR,
+            height=latents.shape[-2] * LATENT_SCALE_FACTOR,
+        )
+
+
+@invocation_output("latents_collection_output")
+class LatentsCollectionOutput(BaseInvocationOutput):
+    collection: list[LatentsField] = OutputField(description="Latents tensor")
+
+
+@invocation_output("conditioning_output")
+class ConditioningOutput(BaseInvocationOutput):
+    conditioning: ConditioningField = OutputField(description=FieldDescriptions.cond)
+
+
+@invocation_output("conditioning_collection_output")
+class ConditioningCollectionOutput(BaseInvocationOutput):
+    collection: list[ConditioningField] = OutputField(description="The output conditioning tensors")
+
+
+@invocation_output("flux_conditioning_output")
+class FluxConditioningOutput(BaseInvocationOutput):
+    conditioning: FluxConditioningField = OutputField(description=FieldDescriptions.cond)
+
+
+@invocation_output("flux_conditioning_collection_output")
+class FluxConditioningCollectionOutput(BaseInvocationOutput):
+    collection: list[FluxConditioningField] = OutputField(description="The output conditioning tensors")
+
+
+@invocation("boolean_collection", title="Boolean Collection Primitive", version="1.0.2")
+class BooleanCollectionInvocation(BaseInvocation):
+    """A collection of boolean primitive values"""
+
+    collection: list[bool] = InputField(default=[], description="The collection of boolean values")
+
+    def invoke(self, context: InvocationContext) -> BooleanCollectionOutput:
+        return BooleanCollectionOutput(collection=self.collection)
+
+
+@invocation("integer_collection", title="Integer Collection Primitive", version="1.0.2")
+class IntegerCollectionInvocation(BaseInvocation):
+    """A collection of integer primitive values"""
+
+    collection: list[int] = InputField(default=[], description="The collection of integer values")
+
+    def invoke(self, context: InvocationContext) -> IntegerCollectionOutput:
+        return IntegerCollectionOutput(collection=self.collection)
+
+
+@invocation("float_collection", title="Float Collection Primitive", version="1.0.2")
+class FloatCollectionInvocation(BaseInvocation):
+    """A collection of float primitive values"""
+
+    collection: list[float] = InputField(default=[], description="The collection of float values")
+
+    def invoke(self, context: InvocationContext) -> FloatCollectionOutput:
+        return FloatCollectionOutput(collection=self.collection)
+
+
+@invocation("string_collection", title="String Collection Primitive", version="1.0.2")
+class StringCollectionInvocation(BaseInvocation):
+    """A collection of string primitive values"""
+
+    collection: list[str] = InputField(default=[], description="The collection of string values")
+
+    def invoke(self, context: InvocationContext) -> StringCollectionOutput:
+        return StringCollectionOutput(collection=self.collection)
+
+
+@invocation("image_collection", title="Image Collection Primitive", version="1.0.1")
+class ImageCollectionInvocation(BaseInvocation):
+    """A collection of image primitive values"""
+
+    collection: list[ImageField] = InputField(default=[], description="The collection of image values")
+
+    def invoke(self, context: InvocationContext) -> ImageCollectionOutput:
+        return ImageCollectionOutput(collection=self.collection)
+
+
+@invocation("latents_collection", title="Latents Collection Primitive", version="1.0.1")
+class LatentsCollectionInvocation(BaseInvocation):
+    """A collection of latents tensor primitive values"""
+
+    collection: list[LatentsField] = InputField(default=[], description="Latents tensor")
+
+    def invoke(self, context: InvocationContext) -> LatentsCollectionOutput:
+        return LatentsCollectionOutput(collection=self.collection)
+
+
+@invocation("conditioning_collection", title="Conditioning Collection Primitive", version="1.0.2")
+class ConditioningCollectionInvocation(BaseInvocation):
+    """A collection of conditioning tensor primitive values"""
+
+    collection: list[ConditioningField] = InputField(default=[], description="The collection of conditioning tensors")
+
+    def invoke(self, context: InvocationContext) -> ConditioningCollectionOutput:
+        return ConditioningCollectionOutput(collection=self.collection)
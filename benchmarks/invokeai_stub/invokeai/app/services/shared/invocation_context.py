@@ -0,0 +1,53 @@
+"""Minimal stand-in for the InvokeAI invocation context, backed by in-memory image and tensor stores."""
+
+import threading
+from itertools import count
+from typing import Any, Optional
+
+from pydantic import BaseModel
+
+
+class ImageDTO(BaseModel):
+    image_name: str
+    width: int
+    height: int
+
+
+class ImagesInterface:
+    def __init__(self) -> None:
+        self._images: dict[str, ImageDTO] = {}
+        self._ids = count()
+        self.get_dto_calls = 0
+
+    def save(self, width: int = 512, height: int = 512, image_name: Optional[str] = None) -> ImageDTO:
+        image_dto = ImageDTO(image_name=image_name or f"image_{next(self._ids)}.png", width=width, height=height)
+        self._images[image_dto.image_name] = image_dto
+        return image_dto
+
+    def get_dto(self, image_name: str) -> ImageDTO:
+        self.get_dto_calls += 1
+        return self._images[image_name]
+
+
+class TensorsInterface:
+    def __init__(self) -> None:
+        self._tensors: dict[str, Any] = {}
+        self._ids = count()
+        self._lock = threading.Lock()
+        self.load_calls = 0
+
+    def save(self, tensor: Any) -> str:
+        name = f"tensor_{next(self._ids)}"
+        self._tensors[name] = tensor
+        return name
+
+    def load(self, name: str) -> Any:
+        with self._lock:
+            self.load_calls += 1
+        return self._tensors[name]
+
+
+class InvocationContext:
+    def __init__(self) -> None:
+        self.images = ImagesInterface()
+        self.tensors = TensorsInterface()
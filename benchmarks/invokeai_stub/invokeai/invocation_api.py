@@ -0,0 +1,80 @@
+"""Minimal stand-in for invokeai.invocation_api, the public API used by custom nodes."""
+
+from invokeai.app.invocations.baseinvocation import (
+    BaseInvocation,
+    BaseInvocationOutput,
+    invocation,
+    invocation_output,
+)
+from invokeai.app.invocations.fields import (
+    ConditioningField,
+    FieldDescriptions,
+    FluxConditioningField,
+    FluxReduxConditioningField,
+    ImageField,
+    Input,
+    InputField,
+    LatentsField,
+    OutputField,
+    TensorField,
+    UIComponent,
+    UIType,
+)
+from invokeai.app.invocations.model import LoRAField, ModelIdentifierField
+from invokeai.app.invocations.primitives import (
+    BooleanCollectionOutput,
+    BooleanOutput,
+    ConditioningCollectionOutput,
+    ConditioningOutput,
+    FloatCollectionOutput,
+    FloatOutput,
+    FluxConditioningCollectionOutput,
+    FluxConditioningOutput,
+    ImageCollectionOutput,
+    ImageOutput,
+    IntegerCollectionOutput,
+    IntegerOutput,
+    LatentsCollectionOutput,
+    LatentsOutput,
+    StringCollectionOutput,
+    StringOutput,
+)
+from invokeai.app.services.shared.invocation_context import InvocationContext
+
+__all__ = [
+    "BaseInvocation",
+    "BaseInvocationOutput",
+    "BooleanCollectionOutput",
+    "BooleanOutput",
+    "ConditioningCollectionOutput",
+    "ConditioningField",
+    "ConditioningOutput",
+    "FieldDescriptions",
+    "FloatCollectionOutput",
+    "FloatOutput",
+    "FluxConditioningCollectionOutput",
+    "FluxConditioningField",
+    "FluxConditioningOutput",
+    "FluxReduxConditioningField",
+    "ImageCollectionOutput",
+    "ImageField",
+    "ImageOutput",
+    "Input",
+    "InputField",
+    "IntegerCollectionOutput",
+    "IntegerOutput",
+    "InvocationContext",
+    "LatentsCollectionOutput",
+    "LatentsField",
+    "LatentsOutput",
+    "LoRAField",
+    "ModelIdentifierField",
+    "OutputField",
+    "StringCollectionOutput",
+    "StringOutput",
+    "TensorField",
+    "UIComponent",
+    "UIType",
+    "invocation",
+    "invocation_output",
+]
@@ -0,0 +1,231 @@
+# 2024 skunkworxdark (https://github.com/skunkworxdark)
+"""Checks that the collection nodes scale near-linearly with the size of the collection.
+
+Runs on any machine with pydantic and numpy, using the local stand-in of the InvokeAI API:
+
+    python benchmarks/scaling.py --max-n 100000
+
+Each case is timed at seven sizes doubling from max_n/64 up to max_n items, taking the median of --repeat runs and
+including the pydantic validation of the node inputs. The slope of log(time) against log(n) is then fitted: a linear
+operation has a slope of about 1 and a quadratic one of 2. Each case has its own limit: 1.15 for single passes, 1.25
+for random access into the collection (cache misses grow with n) and 1.3 for sorts (n log n). --max-slope replaces
+all of them with one limit. The script exits with an error if any case has a slope above its limit.
+"""
+
+import argparse
+import gc
+import random
+import statistics
+import sys
+import time
+from typing import Any, Callable
+
+import numpy as np
+from stub_runtime import load_collection_tools
+
+ct = load_collection_tools(use_stub=True)
+
+from invokeai.app.services.shared.invocation_context import InvocationContext  # noqa: E402
+from invokeai.invocation_api import FluxConditioningField, ImageField, LoRAField, ModelIdentifierField  # noqa: E402
+
+Case = Callable[[int, InvocationContext], Callable[[], Any]]
+
+
+def _strings(n: int) -> list[str]:
+    return [f"item_{i:08d}" for i in random.Random(n).sample(range(n), n)]
+
+
+def _ints(n: int) -> list[int]:
+    return random.Random(n).sample(range(n), n)
+
+
+def _images(n: int) -> list[ImageField]:
+    return [ImageField(image_name=f"{name}.png") for name in _strings(n)]
+
+
+def _loras(n: int) -> list[LoRAField]:
+    return [LoRAField(lora=ModelIdentifierField(key=f"lora_{i % 100}"), weight=i / n) for i in _ints(n)]
+
+
+def _linked_append(n: int, context: InvocationContext) -> Callable[[], Any]:
+    items = _strings(n)
+    return lambda: ct.StringCollectionLinkedInvocation(collection=items, value="new").invoke(context)
+
+
+def _linked_append_images(n: int, context: InvocationContext) -> Callable[[], Any]:
+    items = _images(n)
+    image = ImageField(image_name="new.png")
+    return lambda: ct.ImageCollectionLinkedInvocation(collection=items, image=image).invoke(context)
+
+
+def _join(n: int, context: InvocationContext) -> Callable[[], Any]:
+    items = _strings(n)
+    a, b = items[: n // 2], items[n // 2 :]
+    return lambda: ct.CollectionJoinInvocation(collection_a=a, collection_b=b).invoke(context)
+
+
+def _join_flux_conditioning(n: int, context: InvocationContext) -> Callable[[], Any]:
+    items = [FluxConditioningField(conditioning_name=name) for name in _strings(n)]
+    a, b = items[: n // 2], items[n // 2 :]
+    return lambda: ct.FluxConditioningCollectionJoinInvocation(conditionings_a=a, conditionings_b=b).invoke(context)
+
+
+def _unique_ints(n: int, context: InvocationContext) -> Callable[[], Any]:
+    items = [i % (n // 2) for i in _ints(n)]
+    return lambda: ct.CollectionUniqueInvocation(collection=items).invoke(context)
+
+
+def _unique_images(n: int, context: InvocationContext) -> Callable[[], Any]:
+    images = _images(n // 2)
+    items = images + images
+    return lambda: ct.CollectionUniqueInvocation(collection=items).invoke(context)
+
+
+def _sort_ints(n: int, context: InvocationContext) -> Callable[[], Any]:
+    items = _ints(n)
+    return lambda: ct.CollectionSortInvocation(collection=items).invoke(context)
+
+
+def _sort_strings(n: int, context: InvocationContext) -> Callable[[], Any]:
+    items = _strings(n)
+    return lambda: ct.CollectionSortInvocation(collection=items).invoke(context)
+
+
+def _sort_images(n: int, context: InvocationContext) -> Callable[[], Any]:
+    items = _images(n)
+    return lambda: ct.CollectionSortInvocation(collection=items).invoke(context)
+
+
+def _sort_models_json(n: int, context: InvocationContext) -> Callable[[], Any]:
+    items = _loras(n)
+    return lambda: ct.CollectionSortInvocation(collection=items).invoke(context)
+
+
+def _argsort_ints(n: int, context: InvocationContext) -> Callable[[], Any]:
+    items = _ints(n)
+    return lambda: ct.CollectionArgsortInvocation(collection=items).invoke(context)
+
+
+def _argsort_strings(n: int, context: InvocationContext) -> Callable[[], Any]:
+    items = _strings(n)
+    return lambda: ct.CollectionArgsortInvocation(collection=items, reverse=True).invoke(context)
+
+
+def _apply_permutation(n: int, context: InvocationContext) -> Callable[[], Any]:
+    items = _strings(n)
+    indices = _ints(n)
+    return lambda: ct.CollectionApplyPermutationInvocation(collection=items, indices=indices).invoke(context)
+
+
+def _filter_regex(n: int, context: InvocationContext) -> Callable[[], Any]:
+    items = _strings(n)
+    return lambda: ct.CollectionFilterInvocation(collection=items, predicate="regex", value="5$").invoke(context)
+
+
+def _filter_range(n: int, context: InvocationContext) -> Callable[[], Any]:
+    items = _ints(n)
+    return lambda: ct.CollectionFilterInvocation(collection=items, predicate="range", max_value=n / 2).invoke(context)
+
+
+def _group_by_key_path(n: int, context: InvocationContext) -> Callable[[], Any]:
+    items = _loras(n)
+    return lambda: ct.CollectionGroupInvocation(collection=items, key_path="lora.key").invoke(context)
+
+
+def _gather(n: int, context: InvocationContext) -> Callable[[], Any]:
+    items = _strings(n)
+    indices = [-i for i in _ints(n)]
+    return lambda: ct.CollectionGatherInvocation(collection=items, indices=indices).invoke(context)
+
+
+def _shuffle(n: int, context: InvocationContext) -> Callable[[], Any]:
+    items = _strings(n)
+    return lambda: ct.CollectionShuffleInvocation(collection=items, seed=1).invoke(context)
+
+
+# Slope limits, see the module docstring
+LINEAR = 1.15
+RANDOM_ACCESS = 1.25
+SORT = 1.3
+
+# name -> (case, slope limit)
+CASES: dict[str, tuple[Case, float]] = {
+    "linked append (strings)": (_linked_append, LINEAR),
+    "linked append (images)": (_linked_append_images, LINEAR),
+    "join": (_join, LINEAR),
+    "flux conditioning join": (_join_flux_conditioning, LINEAR),
+    "unique (ints)": (_unique_ints, LINEAR),
+    "unique (images)": (_unique_images, LINEAR),
+    "sort (ints)": (_sort_ints, SORT),
+    "sort (strings)": (_sort_strings, SORT),
+    "sort (images)": (_sort_images, SORT),
+    "sort (models, json key)": (_sort_models_json, SORT),
+    "argsort (ints)": (_argsort_ints, SORT),
+    "argsort (strings)": (_argsort_strings, SORT),
+    "apply permutation": (_apply_permutation, RANDOM_ACCESS),
+    "filter (regex)": (_filter_regex, LINEAR),
+    "filter (numeric range)": (_filter_range, LINEAR),
+    "group (key path)": (_group_by_key_path, LINEAR),
+    "gather": (_gather, RANDOM_ACCESS),
+    "shuffle": (_shuffle, RANDOM_ACCESS),
+}
+
+
+def median_time(run: Callable[[], Any], repeat: int) -> float:
+    """Returns the median of several runs in seconds, with the garbage collector paused while timing."""
+
+    times = []
+    for _ in range(repeat):
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            run()
+            times.append(time.perf_counter() - start)
+        finally:
+            gc.enable()
+    return statistics.median(times)
+
+
+def scaling_slope(case: Case, sizes: list[int], repeat: int, context: InvocationContext) -> tuple[float, list[float]]:
+    """Times a case at each size and returns the fitted log-log slope and the times."""
+
+    times = [median_time(case(n, context), repeat) for n in sizes]
+    slope = float(np.polyfit(np.log(sizes), np.log(times), 1)[0])
+    return slope, times
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--max-n", type=int, default=100_000, help="largest collection size to time")
+    parser.add_argument("--max-slope", type=float, default=None, help="one slope limit for every case")
+    parser.add_argument("--repeat", type=int, default=7, help="runs per size, the median is kept")
+    parser.add_argument("cases", nargs="*", help="names of the cases to run (default all)")
+    args = parser.parse_args()
+
+    unknown = set(args.cases) - set(CASES)
+    if unknown:
+        parser.error(f"unknown cases: {', '.join(sorted(unknown))}")
+    sizes = [args.max_n >> shift for shift in range(6, -1, -1)]
+    context = InvocationContext()
+
+    failures = []
+    print(f"{'case':<26}{'slope':>7}{'limit':>7}  times (ms) at n = {', '.join(map(str, sizes))}")
+    for name in args.cases or CASES:
+        case, max_slope = CASES[name]
+        if args.max_slope is not None:
+            max_slope = args.max_slope
+        slope, times = scaling_slope(case, sizes, args.repeat, context)
+        status = "" if slope <= max_slope else "  <-- above limit"
+        print(f"{name:<26}{slope:>7.2f}{max_slope:>7.2f}  {', '.join(f'{t * 1000:.1f}' for t in times)}{status}")
+        if status:
+            failures.append(name)
+
+    if failures:
+        print(f"{len(failures)} case(s) scale worse than their limit: {', '.join(failures)}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,32 @@
+# 2024 skunkworxdark (https://github.com/skunkworxdark)
+"""Loads the collection_tools node pack outside of InvokeAI.
+
+With use_stub the local stand-in of the InvokeAI invocation API in benchmarks/invokeai_stub is put first on
+sys.path, so only pydantic and numpy need to be installed.
+"""
+
+import importlib
+import sys
+from pathlib import Path
+from types import ModuleType
+
+BENCHMARKS_DIR = Path(__file__).resolve().parent
+PACKAGE_DIR = BENCHMARKS_DIR.parent
+STUB_DIR = BENCHMARKS_DIR / "invokeai_stub"
+
+
+def use_invokeai_stub() -> None:
+    """Makes 'import invokeai' resolve to the local stub."""
+
+    if str(STUB_DIR) not in sys.path:
+        sys.path.insert(0, str(STUB_DIR))
+
+
+def load_collection_tools(use_stub: bool = True) -> ModuleType:
+    """Imports and returns the collection_tools module of this node pack."""
+
+    if use_stub:
+        use_invokeai_stub()
+    if str(PACKAGE_DIR.parent) not in sys.path:
+        sys.path.insert(0, str(PACKAGE_DIR.parent))
+    return importlib.import_module(f"{PACKAGE_DIR.name}.collection_tools")
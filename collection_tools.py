@@ -1,9 +1,21 @@
 # 2024 skunkworxdark (https://github.com/skunkworxdark)
 
 import json
+import math
 import random
-from typing import Any, Optional, TypeVar, Union, cast
-
+import re
+import sys
+import threading
+import time
+import types
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import partial
+from operator import attrgetter
+from typing import Any, Callable, Iterable, Literal, Optional, TypeVar, Union, cast
+
+import numpy as np
 from pydantic import BaseModel
 
 from invokeai.app.invocations.fields import FluxReduxConditioningField
@@ -91,150 +103,536 @@ def append_item_to_list(item_cls: type[T], new_item: Optional[T], items: Union[T
     return existing_items
 
 
-class IndexCollectionMixin(BaseInvocation):
-    """Mixin for invocations that index a specific type of collection."""
+_MISSING = object()
 
-    random: bool = InputField(default=True, description="Random Index?")
-    index: int = InputField(
-        default=0, ge=0, description="zero based index into collection (note index will wrap around if out of bounds)"
+FILTER_PREDICATES = Literal["equals", "not_equals", "regex", "range"]
+
+
+def compile_key_path(key_path: str) -> Callable[[Any], Any]:
+    """Compiles a dotted key path (e.g. 'lora.key') into a getter, returns _MISSING for items without the path."""
+
+    parts = tuple(part for part in key_path.split(".") if part)
+    if not parts:
+        return lambda item: item
+
+    def _get(item: Any) -> Any:
+        for part in parts:
+            if isinstance(item, BaseModel):
+                item = getattr(item, part, _MISSING)
+            elif isinstance(item, dict):
+                item = item.get(part, _MISSING)
+            elif isinstance(item, (list, tuple)) and part.lstrip("-").isdigit():
+                index = int(part)
+                item = item[index] if -len(item) <= index < len(item) else _MISSING
+            else:
+                return _MISSING
+            if item is _MISSING:
+                return _MISSING
+        return item
+
+    return _get
+
+
+def json_key(item: Any) -> str:
+    """Returns a stable JSON string representation of an item, used to sort and compare non-simple items."""
+
+    if isinstance(item, BaseModel):
+        return json.dumps(item.model_dump(), sort_keys=True)
+    return json.dumps(item, sort_keys=True, default=str)
+
+
+def canonical_key(item: Any) -> Any:
+    """Returns a hashable key identifying the value of an item, falling back to its JSON representation."""
+
+    if isinstance(item, BaseModel):
+        return json_key(item)
+    try:
+        hash(item)
+    except TypeError:
+        return json_key(item)
+    return item
+
+
+def _latents_sort_key(latents: LatentsField) -> tuple[str, bool, int]:
+    """Sorts latents by name, then by seed with unseeded latents last."""
+
+    return latents.latents_name, latents.seed is None, latents.seed or 0
+
+
+def _conditioning_sort_key(conditioning: Union[ConditioningField, FluxConditioningField]) -> tuple[str, bool, str]:
+    """Sorts conditionings by name, then by mask name with unmasked conditionings last."""
+
+    mask = conditioning.mask
+    return conditioning.conditioning_name, mask is None, "" if mask is None else mask.tensor_name
+
+
+# Sort keys for field models compared by their names (and the other fields that tell equal names apart),
+# keyed by the item type tag (the class name)
+MODEL_SORT_KEYS: dict[str, tuple[type[BaseModel], Callable[[Any], Any]]] = {
+    model_cls.__name__: (model_cls, sort_key)
+    for model_cls, sort_key in (
+        (ImageField, attrgetter("image_name")),
+        (LatentsField, _latents_sort_key),
+        (ConditioningField, _conditioning_sort_key),
+        (FluxConditioningField, _conditioning_sort_key),
     )
+}
+NUMBER_ITEM_TYPES = ("bool", "int", "float", "number")
+
+
+def detect_item_type(items: list[Any]) -> str:
+    """Detects the common type of the items in one pass.
+
+    Returns "empty", "str", "bool", "int", "float", "number" (mixed numbers), the class name of a field model
+    in MODEL_SORT_KEYS, "model" (other pydantic models) or "json" (anything else).
+    """
 
-    def _get_selected_item(self) -> Any:
-        """Retrieves an item from the 'collection' based on index or randomness."""
-        current_collection = getattr(self, "collection")  # Assumes 'collection' field exists
-        if not current_collection or len(current_collection) == 0:
-            raise ValueError("Input collection is empty.")
-        total = len(current_collection)
-        selected_index = random.randrange(total) if self.random else self.index % total
-        return current_collection[selected_index]
+    item_types = set(map(type, items))
+    if not item_types:
+        return "empty"
+    if len(item_types) == 1:
+        item_type = next(iter(item_types))
+        if item_type in (str, bool, int, float):
+            return item_type.__name__
+        if item_type.__name__ in MODEL_SORT_KEYS and MODEL_SORT_KEYS[item_type.__name__][0] is item_type:
+            return item_type.__name__
+    if all(issubclass(item_type, str) for item_type in item_types):
+        return "str"
+    if all(issubclass(item_type, (int, float)) for item_type in item_types):
+        return "number"
+    if all(issubclass(item_type, BaseModel) for item_type in item_types):
+        return "model"
+    return "json"
 
-    def _get_selected_item_with_info(self) -> tuple[Any, int, int]:
-        """Retrieves an item from the 'collection' based on index or randomness, along with its index and the total count."""
-        current_collection = getattr(self, "collection")  # Assumes 'collection' field exists
-        if not current_collection or len(current_collection) == 0:
-            raise ValueError("Input collection is empty.")
-        total = len(current_collection)
-        selected_index = random.randrange(total) if self.random else self.index % total
-        return current_collection[selected_index], selected_index, total
 
+def sort_key_for(item_type: str) -> Optional[Callable[[Any], Any]]:
+    """Returns the sort key for an item type tag, None when the items can be compared directly."""
+
+    if item_type in ("empty", "str", *NUMBER_ITEM_TYPES):
+        return None
+    if item_type in MODEL_SORT_KEYS:
+        return MODEL_SORT_KEYS[item_type][1]
+    return json_key
+
+
+# NumPy unicode arrays pad every string to the longest one (4 bytes per character), so a few long strings make the
+# array far larger than the strings themselves. Above this many bytes strings are argsorted by Python instead.
+ARGSORT_MAX_STRING_BYTES = 64 * 1024 * 1024
+
+
+def _numpy_sortable_strings(items: list[str]) -> bool:
+    """True if the strings can be argsorted as a NumPy unicode array with the same order as sorted()."""
+
+    if len(items) * max(map(len, items)) * 4 > ARGSORT_MAX_STRING_BYTES:
+        return False
+    # the unicode dtype drops trailing NUL characters, which would make "a\x00" equal to "a"
+    return not any(item.endswith("\x00") for item in items)
 
-@invocation(
-    "boolean_collection_linked",
-    title="Boolean Collection Primitive Linked",
-    tags=["primitives", "boolean", "collection"],
-    category="primitives",
-    version="1.0.1",
-)
-class BooleanCollectionLinkedInvocation(BooleanCollectionInvocation):
-    """A collection of boolean primitive values"""
 
-    value: bool = InputField(default=False, description="The boolean value")
+def _numpy_sort_values(items: list[Any], item_type: str) -> Optional[np.ndarray]:
+    """Returns the items as a NumPy array that sorts exactly like sorted(), or None to sort them in Python.
 
-    def invoke(self, context: InvocationContext) -> BooleanCollectionOutput:
-        self.collection = append_item_to_list(bool, self.value, self.collection)
-        return super().invoke(context)
+    Mixed ints and floats are left to Python, as a float64 array would round ints beyond 2**53.
+    """
 
+    if item_type == "bool":
+        return np.array(items, dtype=bool)
+    if item_type == "int":
+        try:
+            return np.array(items, dtype=np.int64)
+        except OverflowError:
+            return None
+    if item_type == "float":
+        values = np.array(items, dtype=np.float64)
+        # sorted() has no defined order for NaN
+        return None if np.isnan(values).any() else values
+    if item_type == "str" and _numpy_sortable_strings(items):
+        return np.array(items, dtype=str)
+    return None
 
-@invocation(
-    "conditioning_collection_linked",
-    title="Conditioning Collection Primitive Linked",
-    tags=["primitives", "conditioning", "collection"],
-    category="primitives",
-    version="1.0.1",
-)
-class ConditioningCollectionLinkedInvocation(ConditioningCollectionInvocation):
-    """A collection of conditioning tensor primitive values"""
 
-    conditioning: ConditioningField = InputField(description=FieldDescriptions.cond, input=Input.Connection)
+def argsort_items(items: list[Any], reverse: bool = False) -> list[int]:
+    """Returns the stable permutation that sorts the items, using NumPy for single typed numbers and strings."""
 
-    def invoke(self, context: InvocationContext) -> ConditioningCollectionOutput:
-        self.collection = append_item_to_list(ConditioningField, self.conditioning, self.collection)
-        return super().invoke(context)
+    total = len(items)
+    item_type = detect_item_type(items)
+    values = _numpy_sort_values(items, item_type)
 
+    if values is None:
+        key = sort_key_for(item_type)
+        if key is None:
+            return sorted(range(total), key=items.__getitem__, reverse=reverse)
+        return sorted(range(total), key=lambda i: key(items[i]), reverse=reverse)
+    if not reverse:
+        return np.argsort(values, kind="stable").tolist()
+    # a stable descending sort keeps equal items in their original order, like sorted(reverse=True)
+    return (total - 1 - np.argsort(values[::-1], kind="stable")[::-1]).tolist()
 
-@invocation(
-    "float_collection_linked",
-    title="Float Collection Primitive linked",
-    tags=["primitives", "float", "collection"],
-    category="primitives",
-    version="1.0.1",
-)
-class FloatCollectionLinkedInvocation(FloatCollectionInvocation):
-    """A collection of float primitive values"""
 
-    value: float = InputField(default=0.0, description="The float value")
+def check_permutation(indices: list[int], total: int) -> None:
+    """Raises a ValueError unless the indices are a permutation of range(total)."""
 
-    def invoke(self, context: InvocationContext) -> FloatCollectionOutput:
-        self.collection = append_item_to_list(float, self.value, self.collection)
-        return super().invoke(context)
+    if len(indices) != total:
+        raise ValueError(f"Expected {total} indices to match the collection, got {len(indices)}")
+    if total == 0:
+        return
+    try:
+        positions = np.asarray(indices, dtype=np.int64)
+    except OverflowError:
+        raise ValueError("Indices must contain every position of the collection exactly once") from None
+    if positions.min() < 0 or positions.max() >= total or not np.bincount(positions, minlength=total).all():
+        raise ValueError("Indices must contain every position of the collection exactly once")
 
 
-@invocation(
-    "image_collection_linked",
-    title="Image Collection Primitive linked",
-    tags=["primitives", "image", "collection"],
-    category="primitives",
-    version="1.0.1",
-)
-class ImageCollectionLinkedInvocation(ImageCollectionInvocation):
-    """A collection of image primitive values"""
+_MASK64 = (1 << 64) - 1
+
 
-    image: ImageField = InputField(description="The image to load")
+def _mix64(value: int) -> int:
+    """splitmix64 finalizer, a fast 64 bit integer hash."""
 
-    def invoke(self, context: InvocationContext) -> ImageCollectionOutput:
-        self.collection = append_item_to_list(ImageField, self.image, self.collection)
-        return super().invoke(context)
+    value = (value + 0x9E3779B97F4A7C15) & _MASK64
+    value = ((value ^ (value >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    value = ((value ^ (value >> 27)) * 0x94D049BB133111EB) & _MASK64
+    return value ^ (value >> 31)
 
 
-@invocation(
-    "integer_collection_linked",
-    title="Integer Collection Primitive Linked",
-    tags=["primitives", "integer", "collection"],
-    category="primitives",
-    version="1.0.1",
-)
-class IntegerCollectionLinkedInvocation(IntegerCollectionInvocation):
-    """A collection of integer primitive values"""
+def permutation_index(index: int, total: int, seed: int, rounds: int = 6) -> int:
+    """Returns the index-th element of a seeded pseudo random permutation of range(total) in O(1).
 
-    value: int = InputField(default=0, description="The integer value")
+    A Feistel network is a bijection on the smallest even bit width covering total. Values that land outside
+    range(total) are fed through it again (cycle walking), which takes fewer than 4 steps on average. Only the low
+    64 bits of the seed are used.
+    """
 
-    def invoke(self, context: InvocationContext) -> IntegerCollectionOutput:
-        self.collection = append_item_to_list(int, self.value, self.collection)
-        return super().invoke(context)
+    if total <= 0:
+        raise ValueError("Total must be greater than zero.")
+    if total == 1:
+        return 0
+    half_bits = ((total - 1).bit_length() + 1) // 2
+    half_mask = (1 << half_bits) - 1
+    round_keys = [_mix64((seed & _MASK64) ^ _mix64(round_index)) for round_index in range(rounds)]
 
+    value = index % total
+    while True:
+        left, right = value >> half_bits, value & half_mask
+        for round_key in round_keys:
+            left, right = right, left ^ (_mix64(round_key ^ right) & half_mask)
+        value = (left << half_bits) | right
+        if value < total:
+            return value
 
-@invocation(
-    "latents_collection_linked",
-    title="Latents Collection Primitive Linked",
-    tags=["primitives", "latents", "collection"],
-    category="primitives",
-    version="1.0.1",
-)
-class LatentsCollectionLinkedInvocation(LatentsCollectionInvocation):
-    """A collection of latents tensor primitive values"""
 
-    latents: Optional[LatentsField] = InputField(default=None, description="The latents tensor", input=Input.Connection)
+GATHER_POLICIES = Literal["wrap", "clip", "error"]
 
-    def invoke(self, context: InvocationContext) -> LatentsCollectionOutput:
-        self.collection = append_item_to_list(LatentsField, self.latents, self.collection)
-        return super().invoke(context)
 
+def resolve_indices(indices: list[int], total: int, policy: str = "wrap") -> list[int]:
+    """Resolves indices against a collection size in one vectorized pass, negative indices count from the end.
 
-@invocation(
-    "string_collection_linked",
-    title="String Collection Primitive Linked",
-    tags=["primitives", "string", "collection"],
-    category="primitives",
-    version="1.0.1",
-)
-class StringCollectionLinkedInvocation(StringCollectionInvocation):
-    """Allows creation of collection and optionally add a collection"""
+    Out of range indices wrap around, are clipped to the first/last item or raise an error depending on the policy.
+    """
 
-    value: Optional[str] = InputField(default=None, description="The string value", ui_component=UIComponent.Textarea)
+    if not indices:
+        return []
+    if total == 0:
+        raise ValueError("Input collection is empty.")
+    try:
+        positions = np.asarray(indices, dtype=np.int64)
+    except OverflowError:
+        # indices beyond int64 are resolved by Python, where wrap and clip are still well defined
+        if policy == "wrap":
+            return [index % total for index in indices]
+        if policy == "clip":
+            return [min(max(index + total if index < 0 else index, 0), total - 1) for index in indices]
+        bad_index = next(index for index in indices if not -(2**63) <= index < 2**63)
+        raise ValueError(f"Index {bad_index} is out of range for a collection of {total} items") from None
+    if policy == "wrap":
+        return np.mod(positions, total).tolist()
+
+    positions = np.where(positions < 0, positions + total, positions)
+    if policy == "clip":
+        return np.clip(positions, 0, total - 1).tolist()
+    out_of_range = (positions < 0) | (positions >= total)
+    if out_of_range.any():
+        bad_index = indices[int(np.argmax(out_of_range))]
+        raise ValueError(f"Index {bad_index} is out of range for a collection of {total} items")
+    return positions.tolist()
+
+
+def gather_items(collection: list[T], positions: list[int]) -> list[T]:
+    """Returns the items at the given (already resolved) positions."""
+
+    return list(map(collection.__getitem__, positions))
+
+
+# Largest magnitude up to which every integer is exactly representable as a float64
+_FLOAT_EXACT_INT = 2**53
+
+
+def _parse_number(value: str) -> Any:
+    """Parses a string as an int when it is one (so large ints compare exactly), else as a float, else _MISSING."""
+
+    try:
+        return int(value)
+    except ValueError:
+        pass
+    try:
+        return float(value)
+    except ValueError:
+        return _MISSING
+
+
+def _coerce_like(sample: Any, value: str) -> Any:
+    """Coerces the string 'value' to the type of 'sample' so the two can be compared for equality."""
+
+    if isinstance(sample, bool):
+        return value.strip().lower() in ("true", "1", "yes")
+    if isinstance(sample, (int, float)):
+        return _parse_number(value)
+    return value
+
+
+def compile_predicate(
+    predicate: str, value: str = "", min_value: Optional[float] = None, max_value: Optional[float] = None
+) -> Callable[[Any], bool]:
+    """Compiles a filter predicate once into a callable that tests a single value."""
+
+    if predicate == "regex":
+        try:
+            pattern = re.compile(value)
+        except re.error as e:
+            raise ValueError(f"Invalid regex pattern '{value}': {e}") from e
+        return lambda v: v is not _MISSING and pattern.search(str(v)) is not None
+
+    if predicate == "range":
+        low = -math.inf if min_value is None else min_value
+        high = math.inf if max_value is None else max_value
+        return lambda v: isinstance(v, (int, float)) and not isinstance(v, bool) and low <= v <= high
+
+    if predicate not in ("equals", "not_equals"):
+        raise ValueError(f"Unknown predicate '{predicate}'")
+
+    # the comparison target is coerced once per item type rather than once per item
+    targets: dict[type, Any] = {}
+
+    def _equals(v: Any) -> bool:
+        if v is _MISSING:
+            return False
+        item_type = type(v)
+        if item_type not in targets:
+            targets[item_type] = _coerce_like(v, value)
+        return v == targets[item_type]
+
+    if predicate == "not_equals":
+        return lambda v: v is not _MISSING and not _equals(v)
+    return _equals
+
+
+def _numeric_array(items: list[Any]) -> Optional[np.ndarray]:
+    """Returns the items as a NumPy array if they are all ints/floats (not bools), otherwise None.
+
+    Collections with ints beyond +-2**53 are left to Python, as NumPy would compare them with floats inexactly.
+    """
+
+    item_types = {type(item) for item in items}
+    if not item_types or not item_types <= {int, float}:
+        return None
+    try:
+        values = np.array(items, dtype=np.float64 if float in item_types else np.int64)
+    except OverflowError:
+        return None
+    if int in item_types and (values.min() < -_FLOAT_EXACT_INT or values.max() > _FLOAT_EXACT_INT):
+        return None
+    return values
 
-    def invoke(self, context: InvocationContext) -> StringCollectionOutput:
-        self.collection = append_item_to_list(str, self.value, self.collection)
-        return super().invoke(context)
+
+class IndexCollectionMixin(BaseInvocation):
+    """Mixin for invocations that index a specific type of collection."""
+
+    random: bool = InputField(default=True, description="Random Index?")
+    index: int = InputField(
+        default=0, ge=0, description="zero based index into collection (note index will wrap around if out of bounds)"
+    )
+
+    def _get_selected_item(self) -> Any:
+        """Retrieves an item from the 'collection' based on index or randomness."""
+        current_collection = getattr(self, "collection")  # Assumes 'collection' field exists
+        if not current_collection or len(current_collection) == 0:
+            raise ValueError("Input collection is empty.")
+        total = len(current_collection)
+        selected_index = random.randrange(total) if self.random else self.index % total
+        return current_collection[selected_index]
+
+    def _get_selected_item_with_info(self) -> tuple[Any, int, int]:
+        """Retrieves an item from the 'collection' based on index or randomness, along with its index and the total count."""
+        current_collection = getattr(self, "collection")  # Assumes 'collection' field exists
+        if not current_collection or len(current_collection) == 0:
+            raise ValueError("Input collection is empty.")
+        total = len(current_collection)
+        selected_index = random.randrange(total) if self.random else self.index % total
+        return current_collection[selected_index], selected_index, total
+
+
+PREFETCH_CACHE_MAX_BYTES = 512 * 1024 * 1024
+# Prefetched values not picked up within this many seconds (e.g. a cancelled walk) are dropped
+PREFETCH_CACHE_TTL_SECONDS = 600.0
+
+
+def _estimate_nbytes(value: Any) -> int:
+    """Estimates the memory used by a loaded value (tensors, arrays or models)."""
+
+    nbytes = getattr(value, "nbytes", None)
+    if isinstance(nbytes, int):
+        return nbytes
+    if hasattr(value, "element_size") and hasattr(value, "nelement"):
+        return value.element_size() * value.nelement()
+    if isinstance(value, BaseModel):
+        return len(value.model_dump_json())
+    return sys.getsizeof(value)
+
+
+class PrefetchCache:
+    """Thread safe cache of values loaded in the background, bounded by the estimated bytes of the cached values.
+
+    Loads still in flight count against the byte cap with the size of the last loaded value, and cached values
+    expire after ttl seconds.
+    """
+
+    def __init__(self, max_bytes: int, ttl: float = PREFETCH_CACHE_TTL_SECONDS, max_workers: int = 2) -> None:
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._max_workers = max_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        # key -> (value, size, expiry time)
+        self._entries: OrderedDict[str, tuple[Any, int, float]] = OrderedDict()
+        # key -> (token, future, reserved bytes), the token tells a discarded load apart from a rescheduled one
+        self._pending: dict[str, tuple[object, Future, int]] = {}
+        self._total_bytes = 0
+        self._reserved_bytes = 0
+        self._last_size = 0
+
+    def get(self, key: str, loader: Callable[[], Any]) -> Any:
+        """Returns (and releases) a prefetched value, waits for it if it is still loading or loads it directly."""
+        with self._lock:
+            self._expire(time.monotonic())
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self._total_bytes -= entry[1]
+                return entry[0]
+            pending = self._pending.get(key)
+        if pending is not None:
+            try:
+                pending[1].result()
+            except Exception:
+                return loader()
+            return self.get(key, loader)
+        return loader()
+
+    def prefetch(self, key: str, loader: Callable[[], Any]) -> None:
+        """Schedules a value to be loaded in the background if it is not already cached or loading and fits."""
+        with self._lock:
+            if key in self._entries or key in self._pending:
+                return
+            self._expire(time.monotonic())
+            reserved = self._last_size
+            if self._total_bytes + self._reserved_bytes + reserved > self.max_bytes:
+                return
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._max_workers, thread_name_prefix="collection_tools_prefetch"
+                )
+            token = object()
+            self._reserved_bytes += reserved
+            self._pending[key] = (token, self._executor.submit(self._load, key, token, loader), reserved)
+
+    def discard(self, keys: Iterable[str]) -> None:
+        """Drops the cached values for the keys, loads still in flight for them are dropped when they finish."""
+        with self._lock:
+            for key in keys:
+                entry = self._entries.pop(key, None)
+                if entry is not None:
+                    self._total_bytes -= entry[1]
+                pending = self._pending.pop(key, None)
+                if pending is not None:
+                    self._reserved_bytes -= pending[2]
+                    pending[1].cancel()
+
+    def _expire(self, now: float) -> None:
+        """Drops expired values, the caller holds the lock."""
+        while self._entries:
+            key, (_, size, expires) = next(iter(self._entries.items()))
+            if expires > now:
+                break
+            del self._entries[key]
+            self._total_bytes -= size
+
+    def _release(self, key: str, token: object) -> bool:
+        """Removes a finished load from the pending loads, False if it was discarded meanwhile."""
+        pending = self._pending.get(key)
+        if pending is None or pending[0] is not token:
+            return False
+        del self._pending[key]
+        self._reserved_bytes -= pending[2]
+        return True
+
+    def _load(self, key: str, token: object, loader: Callable[[], Any]) -> None:
+        try:
+            value = loader()
+        except Exception:
+            with self._lock:
+                self._release(key, token)
+            raise
+        size = _estimate_nbytes(value)
+        with self._lock:
+            self._last_size = size
+            if not self._release(key, token) or size > self.max_bytes:
+                return
+            self._entries[key] = (value, size, time.monotonic() + self.ttl)
+            self._total_bytes += size
+            while self._total_bytes + self._reserved_bytes > self.max_bytes and self._entries:
+                _, (_, evicted_size, _) = self._entries.popitem(last=False)
+                self._total_bytes -= evicted_size
+
+
+_PREFETCH_CACHE = PrefetchCache(PREFETCH_CACHE_MAX_BYTES)
+
+
+class PrefetchIndexCollectionMixin(IndexCollectionMixin):
+    """Mixin for index invocations that can load the next items of a sequential walk in the background."""
+
+    prefetch: int = InputField(
+        default=0,
+        ge=0,
+        le=16,
+        description="Number of following items to load in the background when not random (0 disables prefetch)",
+    )
+
+    def _load_with_prefetch(
+        self, selected_index: int, key_fn: Callable[[Any], str], loader: Callable[[Any], Any]
+    ) -> Any:
+        """Loads the selected item, through the prefetch cache when prefetch is enabled and the walk is sequential.
+
+        Only items after the selected one are prefetched (the walk does not wrap around), and the cached items of
+        the collection are dropped when a walk starts at its first item or reaches its last one, so a new session
+        never sees values left over from an earlier walk.
+        """
+        current_collection = getattr(self, "collection")  # Assumes 'collection' field exists
+        selected_item = current_collection[selected_index]
+        if self.prefetch == 0 or self.random:
+            return loader(selected_item)
+
+        total = len(current_collection)
+        last_index = total - 1
+        if selected_index == 0:
+            _PREFETCH_CACHE.discard(map(key_fn, current_collection))
+        value = _PREFETCH_CACHE.get(key_fn(selected_item), partial(loader, selected_item))
+        if selected_index == last_index:
+            _PREFETCH_CACHE.discard(map(key_fn, current_collection))
+            return value
+
+        for next_item in current_collection[selected_index + 1 : min(selected_index + self.prefetch, last_index) + 1]:
+            _PREFETCH_CACHE.prefetch(key_fn(next_item), partial(loader, next_item))
+        return value
 
 
 @invocation_output("lora_collection_output")
@@ -285,54 +683,7 @@ class LoRACollectionLinkedInvocation(LoRACollectionInvocation):
         return super().invoke(context)
 
 
-@invocation(
-    "flux_conditioning_collection",
-    title="Flux Conditioning Collection Primitive",
-    tags=["flux", "text_encoder", "conditioning", "primitives", "collection"],
-    category="primitives",
-    version="1.0.0",
-)
-class FluxConditioningCollectionInvocation(BaseInvocation):
-    """A collection of flux conditioning tensor primitive values"""
-
-    conditioning: list[FluxConditioningField] = InputField(
-        default=[],
-        description=FieldDescriptions.cond,
-        title="FLUX Conditionings",
-    )
-
-    def invoke(self, context: InvocationContext) -> FluxConditioningCollectionOutput:
-        return FluxConditioningCollectionOutput(collection=self.conditioning)
-
-
-@invocation(
-    "flux_conditioning_collection_join",
-    title="Flux Conditioning Collection join",
-    tags=["flux", "text_encoder", "conditioning", "collection", "join"],
-    category="util",
-    version="1.0.0",
-)
-class FluxConditioningCollectionJoinInvocation(BaseInvocation):
-    """Join a flux conditioning tensor or collections into a single collection of flux conditioning tensors"""
-
-    conditionings_a: Optional[Union[FluxConditioningField, list[FluxConditioningField]]] = InputField(
-        description=FieldDescriptions.cond,
-        title="FLUX Text Encoder Conditioning or Collection",
-        default=None,
-        input=Input.Connection,
-    )
-    conditionings_b: Optional[Union[FluxConditioningField, list[FluxConditioningField]]] = InputField(
-        description=FieldDescriptions.cond,
-        title="FLUX Text Encoder Conditioning or Collection",
-        default=None,
-        input=Input.Connection,
-    )
-
-    def invoke(self, context: InvocationContext) -> FluxConditioningCollectionOutput:
-        conditionings = join_collections(FluxConditioningField, self.conditionings_a, self.conditionings_b)
-        return FluxConditioningCollectionOutput(collection=conditionings)
-
-
+# --FLUX ControlNet Collection
 @invocation_output("flux_controlnet_collection_output")
 class FluxControlNetCollectionOutput(BaseInvocationOutput):
     collection: list[FluxControlNetField] = OutputField(
@@ -340,107 +691,577 @@ class FluxControlNetCollectionOutput(BaseInvocationOutput):
     )
 
 
-# --FLUX ControlNet Collection
-@invocation(
-    "flux_controlnet_collection",
-    title="FLUX ControlNet Collection Primitive",
-    tags=["flux", "controlnet", "primitives", "collection"],
-    category="primitives",
-    version="1.0.0",
-)
-class FluxControlNetCollectionInvocation(BaseInvocation):
-    """A collection of flux controlnet primitive values"""
-
-    collection: list[FluxControlNetField] = InputField(
-        description="FLUX ControlNets",
-        title="FLUX ControlNet Collection",
+# --FLUX Redux Collection
+@invocation_output("flux_redux_collection_output")
+class FluxReduxCollectionOutput(BaseInvocationOutput):
+    collection: list[FluxReduxConditioningField] = OutputField(
+        description=FieldDescriptions.control, title="FLUX Redux Collection"
     )
 
-    def invoke(self, context: InvocationContext) -> FluxControlNetCollectionOutput:
-        return FluxControlNetCollectionOutput(collection=self.collection)
 
+# ---------------------------------- Typed collection node factory -----------------
+@dataclass(frozen=True)
+class NodeSpec:
+    """The registration details and input field of one generated node.
+
+    Any of doc, tags, category and field_name left as None fall back to the default for the kind of node.
+    """
+
+    invocation_type: str
+    title: str
+    version: str = "1.0.0"
+    doc: Optional[str] = None
+    tags: Optional[tuple[str, ...]] = None
+    category: Optional[str] = None
+    class_name: Optional[str] = None
+    field_name: Optional[str] = None
+    field_annotation: Any = None
+    field_kwargs: dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class CollectionTypeSpec:
+    """A row of the typed collection table, describing the nodes generated for one item type."""
+
+    name: str
+    item_cls: type
+    collection_output: type[BaseInvocationOutput]
+    item_output: Optional[type[BaseInvocationOutput]] = None
+    build_item_output: Optional[Callable[[Any, InvocationContext, Any, int], BaseInvocationOutput]] = None
+    collection: Optional[NodeSpec] = None
+    linked: Optional[NodeSpec] = None
+    linked_base: Optional[type[BaseInvocation]] = None
+    join: Optional[NodeSpec] = None
+    index: Optional[NodeSpec] = None
+    index_mixin: type[IndexCollectionMixin] = IndexCollectionMixin
+    sample: Optional[NodeSpec] = None
+    gather: Optional[NodeSpec] = None
+
+
+def _new_model_class(
+    class_name: str, bases: tuple[type, ...], doc: str, fields: dict[str, tuple[Any, Any]], **attributes: Any
+) -> type:
+    """Creates a pydantic model class in this module from (annotation, field info) pairs."""
+
+    namespace: dict[str, Any] = {
+        "__module__": __name__,
+        "__qualname__": class_name,
+        "__doc__": doc,
+        "__annotations__": {field_name: annotation for field_name, (annotation, _) in fields.items()},
+        **attributes,
+    }
+    namespace.update({field_name: field_info for field_name, (_, field_info) in fields.items()})
+    return types.new_class(class_name, bases, exec_body=lambda ns: ns.update(namespace))
+
+
+def _make_invocation(
+    node: NodeSpec,
+    default_class_name: str,
+    default_doc: str,
+    default_tags: tuple[str, ...],
+    default_category: str,
+    bases: tuple[type, ...],
+    fields: dict[str, tuple[Any, Any]],
+    invoke: Callable[..., BaseInvocationOutput],
+    output_cls: type[BaseInvocationOutput],
+    use_cache: bool = True,
+) -> type[BaseInvocation]:
+    """Builds and registers an invocation class from a node spec, its input fields and its invoke function."""
+
+    class_name = node.class_name or default_class_name
+    invoke.__annotations__ = {"context": InvocationContext, "return": output_cls}
+    invoke.__qualname__ = f"{class_name}.invoke"
+    cls = _new_model_class(class_name, bases, node.doc or default_doc, fields, invoke=invoke)
+    return invocation(
+        node.invocation_type,
+        title=node.title,
+        tags=list(node.tags or default_tags),
+        category=node.category or default_category,
+        version=node.version,
+        use_cache=use_cache,
+    )(cls)
+
+
+def _make_collection_node(spec: CollectionTypeSpec, node: NodeSpec) -> type[BaseInvocation]:
+    field_name = node.field_name or "collection"
+    output_cls = spec.collection_output
+
+    def invoke(self: BaseInvocation, context: InvocationContext) -> BaseInvocationOutput:
+        return output_cls(collection=getattr(self, field_name))
+
+    return _make_invocation(
+        node,
+        f"{spec.name}CollectionInvocation",
+        f"A collection of {spec.name} primitive values",
+        ("primitives", spec.name.lower(), "collection"),
+        "primitives",
+        (BaseInvocation,),
+        {field_name: (node.field_annotation or list[spec.item_cls], InputField(**node.field_kwargs))},
+        invoke,
+        output_cls,
+    )
 
-@invocation(
-    "flux_controlnet_collection_join",
-    title="FLUX ControlNet Collection join",
-    tags=["flux", "controlnet", "collection", "join"],
-    category="util",
-    version="1.0.0",
-)
-class FluxControlNetCollectionJoinInvocation(BaseInvocation):
-    """Join a flux controlnet tensors or collections into a single collection of flux controlnet tensors"""
 
-    controlnets_a: Optional[Union[FluxControlNetField, list[FluxControlNetField]]] = InputField(
-        description="FLUX ControlNets",
-        title="FLUX ControlNet or Collection",
-        default=None,
-        input=Input.Connection,
-    )
-    controlnets_b: Optional[Union[FluxControlNetField, list[FluxControlNetField]]] = InputField(
-        description="FLUX ControlNets",
-        title="FLUX ControlNet or Collection",
-        default=None,
-        input=Input.Connection,
+def _make_linked_node(spec: CollectionTypeSpec, node: NodeSpec) -> type[BaseInvocation]:
+    if spec.linked_base is None:
+        raise ValueError(f"Linked node for '{spec.name}' needs a linked_base collection invocation")
+    field_name = node.field_name or "value"
+    item_cls = spec.item_cls
+    base = spec.linked_base
+
+    def invoke(self: BaseInvocation, context: InvocationContext) -> BaseInvocationOutput:
+        self.collection = append_item_to_list(item_cls, getattr(self, field_name), self.collection)
+        return base.invoke(self, context)
+
+    return _make_invocation(
+        node,
+        f"{spec.name}CollectionLinkedInvocation",
+        f"A collection of {spec.name} primitive values",
+        ("primitives", spec.name.lower(), "collection"),
+        "primitives",
+        (base,),
+        {field_name: (node.field_annotation or item_cls, InputField(**node.field_kwargs))},
+        invoke,
+        spec.collection_output,
     )
 
-    def invoke(self, context: InvocationContext) -> FluxControlNetCollectionOutput:
-        controlnets = join_collections(FluxControlNetField, self.controlnets_a, self.controlnets_b)
-        return FluxControlNetCollectionOutput(collection=controlnets)
 
-
-# --FLUX Redux Collection
-@invocation_output("flux_redux_collection_output")
-class FluxReduxCollectionOutput(BaseInvocationOutput):
-    collection: list[FluxReduxConditioningField] = OutputField(
-        description=FieldDescriptions.control, title="FLUX Redux Collection"
+def _make_join_node(spec: CollectionTypeSpec, node: NodeSpec) -> type[BaseInvocation]:
+    field_name = node.field_name or "collection"
+    item_cls = spec.item_cls
+    output_cls = spec.collection_output
+    annotation = node.field_annotation or Optional[Union[item_cls, list[item_cls]]]
+    field_kwargs = {"default": None, "input": Input.Connection, **node.field_kwargs}
+
+    def invoke(self: BaseInvocation, context: InvocationContext) -> BaseInvocationOutput:
+        items = join_collections(item_cls, getattr(self, f"{field_name}_a"), getattr(self, f"{field_name}_b"))
+        return output_cls(collection=items)
+
+    return _make_invocation(
+        node,
+        f"{spec.name}CollectionJoinInvocation",
+        f"Join {spec.name} items or collections into a single collection",
+        ("collection", "join"),
+        "util",
+        (BaseInvocation,),
+        {
+            f"{field_name}_a": (annotation, InputField(**field_kwargs)),
+            f"{field_name}_b": (annotation, InputField(**field_kwargs)),
+        },
+        invoke,
+        output_cls,
     )
 
 
-@invocation(
-    "flux_redux_collection",
-    title="FLUX Redux Collection Primitive",
-    tags=["flux", "redux", "primitives", "collection"],
-    category="primitives",
-    version="1.0.0",
-)
-class FluxReduxCollectionInvocation(BaseInvocation):
-    """A collection of flux redux primitive values"""
-
-    collection: list[FluxReduxConditioningField] = InputField(
-        description="FLUX Redux Collection",
-        title="FLUX Redux Collection",
+def _make_index_node(spec: CollectionTypeSpec, node: NodeSpec) -> type[BaseInvocation]:
+    if spec.item_output is None or spec.build_item_output is None:
+        raise ValueError(f"Index node for '{spec.name}' needs an item_output and build_item_output")
+    build_item_output = spec.build_item_output
+
+    def invoke(self: IndexCollectionMixin, context: InvocationContext) -> BaseInvocationOutput:
+        selected_item, selected_index, _ = self._get_selected_item_with_info()
+        return build_item_output(self, context, selected_item, selected_index)
+
+    return _make_invocation(
+        node,
+        f"{spec.name}CollectionIndexInvocation",
+        "CollectionIndex Picks an index out of a collection with a random option",
+        ("collection", "index"),
+        "util",
+        (spec.index_mixin, BaseInvocation),
+        {"collection": (node.field_annotation or list[spec.item_cls], InputField(**node.field_kwargs))},
+        invoke,
+        spec.item_output,
+        use_cache=False,
     )
 
-    def invoke(self, context: InvocationContext) -> FluxReduxCollectionOutput:
-        return FluxReduxCollectionOutput(collection=self.collection)
 
+def _make_sample_node(spec: CollectionTypeSpec, node: NodeSpec) -> type[BaseInvocation]:
+    output_cls = spec.collection_output
+
+    def invoke(self: BaseInvocation, context: InvocationContext) -> BaseInvocationOutput:
+        collection = getattr(self, "collection")
+        rng = random.Random(self.seed) if self.seed is not None else random
+        return output_cls(collection=rng.sample(collection, min(self.count, len(collection))))
+
+    return _make_invocation(
+        node,
+        f"{spec.name}CollectionSampleInvocation",
+        "CollectionSample Picks random items out of a collection without repeats",
+        ("collection", "sample", "random"),
+        "util",
+        (BaseInvocation,),
+        {
+            "collection": (node.field_annotation or list[spec.item_cls], InputField(**node.field_kwargs)),
+            "count": (int, InputField(default=1, ge=1, description="Number of items to pick (capped at the size)")),
+            "seed": (Optional[int], InputField(default=None, description="Seed for the pick, random if not set")),
+        },
+        invoke,
+        output_cls,
+        use_cache=False,
+    )
 
-@invocation(
-    "flux_redux_collection_join",
-    title="FLUX Redux Collection join",
-    tags=["flux", "redux", "collection", "join"],
-    category="util",
-    version="1.0.0",
-)
-class FluxReduxCollectionJoinInvocation(BaseInvocation):
-    """Join a flux redux tensor or collections into a single collection of flux redux tensors"""
 
-    conditionings_a: Optional[Union[FluxReduxConditioningField, list[FluxReduxConditioningField]]] = InputField(
-        description="FLUX Reduxs",
-        title="FLUX Redux or Collection",
-        default=None,
-        input=Input.Connection,
+def _make_gather_node(spec: CollectionTypeSpec, node: NodeSpec) -> type[BaseInvocation]:
+    output_name = f"{spec.name}CollectionGatherOutput"
+    output_cls = invocation_output(f"{node.invocation_type}_output")(
+        _new_model_class(
+            output_name,
+            (BaseInvocationOutput,),
+            "The output of a typed collection gather node.",
+            {
+                "collection": (list[spec.item_cls], OutputField(description="The gathered items", title="Collection")),
+                "indices": (list[int], OutputField(description="The resolved index of each item", title="Indices")),
+            },
+        )
     )
-    conditionings_b: Optional[Union[FluxReduxConditioningField, list[FluxReduxConditioningField]]] = InputField(
-        description="FLUX Reduxs",
-        title="FLUX Redux or Collection",
-        default=None,
-        input=Input.Connection,
+    TYPED_COLLECTION_OUTPUTS[output_name] = output_cls
+
+    def invoke(self: BaseInvocation, context: InvocationContext) -> BaseInvocationOutput:
+        collection = getattr(self, "collection")
+        positions = resolve_indices(self.indices, len(collection), self.policy)
+        return output_cls(collection=gather_items(collection, positions), indices=positions)
+
+    return _make_invocation(
+        node,
+        f"{spec.name}CollectionGatherInvocation",
+        "CollectionGather Picks the items at many indices out of a collection in one pass",
+        ("collection", "gather", "index"),
+        "util",
+        (BaseInvocation,),
+        {
+            "collection": (node.field_annotation or list[spec.item_cls], InputField(**node.field_kwargs)),
+            "indices": (list[int], InputField(default=[], description="The indices of the items to pick")),
+            "policy": (GATHER_POLICIES, InputField(default="wrap", description="How to handle out of range indices")),
+        },
+        invoke,
+        output_cls,
+        use_cache=False,
+    )
+
+
+def build_typed_collection_nodes(spec: CollectionTypeSpec) -> dict[str, type[BaseInvocation]]:
+    """Generates and registers the nodes described by a row of the typed collection table, keyed by kind."""
+
+    nodes: dict[str, type[BaseInvocation]] = {}
+    if spec.collection is not None:
+        nodes["collection"] = _make_collection_node(spec, spec.collection)
+    if spec.linked is not None:
+        nodes["linked"] = _make_linked_node(spec, spec.linked)
+    if spec.join is not None:
+        nodes["join"] = _make_join_node(spec, spec.join)
+    if spec.index is not None:
+        nodes["index"] = _make_index_node(spec, spec.index)
+    if spec.sample is not None:
+        nodes["sample"] = _make_sample_node(spec, spec.sample)
+    if spec.gather is not None:
+        nodes["gather"] = _make_gather_node(spec, spec.gather)
+    return nodes
+
+
+def _image_item_output(
+    node: PrefetchIndexCollectionMixin, context: InvocationContext, item: ImageField, index: int
+) -> ImageOutput:
+    image_dto = node._load_with_prefetch(
+        index,
+        lambda image: f"image:{image.image_name}",
+        lambda image: context.images.get_dto(image.image_name),
     )
+    return ImageOutput.build(image_dto)
 
-    def invoke(self, context: InvocationContext) -> FluxReduxCollectionOutput:
-        conditionings = join_collections(FluxReduxConditioningField, self.conditionings_a, self.conditionings_b)
-        return FluxReduxCollectionOutput(collection=conditionings)
+
+def _latents_item_output(
+    node: PrefetchIndexCollectionMixin, context: InvocationContext, item: LatentsField, index: int
+) -> LatentsOutput:
+    latents = node._load_with_prefetch(
+        index,
+        lambda latents: f"latents:{latents.latents_name}",
+        lambda latents: context.tensors.load(latents.latents_name),
+    )
+    return LatentsOutput.build(latents_name=item.latents_name, latents=latents, seed=item.seed)
+
+
+# Output classes generated for node kinds that need one, keyed by class name
+TYPED_COLLECTION_OUTPUTS: dict[str, type[BaseInvocationOutput]] = {}
+
+# Adding a collection type only needs a row here, the nodes are generated from it at import time.
+# Existing rows keep the invocation types, titles, versions and fields of the nodes they replaced.
+TYPED_COLLECTION_TYPES: list[CollectionTypeSpec] = [
+    CollectionTypeSpec(
+        name="Boolean",
+        item_cls=bool,
+        collection_output=BooleanCollectionOutput,
+        item_output=BooleanOutput,
+        build_item_output=lambda node, context, item, index: BooleanOutput(value=item),
+        linked=NodeSpec(
+            "boolean_collection_linked",
+            "Boolean Collection Primitive Linked",
+            version="1.0.1",
+            doc="A collection of boolean primitive values",
+            field_kwargs={"default": False, "description": "The boolean value"},
+        ),
+        linked_base=BooleanCollectionInvocation,
+        index=NodeSpec(
+            "bool_collection_index",
+            "Bool Collection Index",
+            version="1.0.1",
+            class_name="BoolCollectionIndexInvocation",
+            field_kwargs={"description": "bool collection"},
+        ),
+        sample=NodeSpec(
+            "boolean_collection_sample", "Boolean Collection Sample", field_kwargs={"description": "bool collection"}
+        ),
+    ),
+    CollectionTypeSpec(
+        name="Conditioning",
+        item_cls=ConditioningField,
+        collection_output=ConditioningCollectionOutput,
+        linked=NodeSpec(
+            "conditioning_collection_linked",
+            "Conditioning Collection Primitive Linked",
+            version="1.0.1",
+            doc="A collection of conditioning tensor primitive values",
+            field_name="conditioning",
+            field_kwargs={"description": FieldDescriptions.cond, "input": Input.Connection},
+        ),
+        linked_base=ConditioningCollectionInvocation,
+    ),
+    CollectionTypeSpec(
+        name="Float",
+        item_cls=float,
+        collection_output=FloatCollectionOutput,
+        item_output=FloatOutput,
+        build_item_output=lambda node, context, item, index: FloatOutput(value=item),
+        linked=NodeSpec(
+            "float_collection_linked",
+            "Float Collection Primitive linked",
+            version="1.0.1",
+            doc="A collection of float primitive values",
+            field_kwargs={"default": 0.0, "description": "The float value"},
+        ),
+        linked_base=FloatCollectionInvocation,
+        index=NodeSpec(
+            "float_collection_index",
+            "Float Collection Index",
+            version="1.1.1",
+            field_kwargs={"description": "float collection"},
+        ),
+        sample=NodeSpec(
+            "float_collection_sample", "Float Collection Sample", field_kwargs={"description": "float collection"}
+        ),
+        gather=NodeSpec(
+            "float_collection_gather", "Float Collection Gather", field_kwargs={"description": "float collection"}
+        ),
+    ),
+    CollectionTypeSpec(
+        name="Image",
+        item_cls=ImageField,
+        collection_output=ImageCollectionOutput,
+        item_output=ImageOutput,
+        build_item_output=_image_item_output,
+        linked=NodeSpec(
+            "image_collection_linked",
+            "Image Collection Primitive linked",
+            version="1.0.1",
+            doc="A collection of image primitive values",
+            field_name="image",
+            field_kwargs={"description": "The image to load"},
+        ),
+        linked_base=ImageCollectionInvocation,
+        index=NodeSpec(
+            "image_collection_index",
+            "Image Collection Index",
+            version="1.1.0",
+            field_kwargs={"description": "image collection"},
+        ),
+        index_mixin=PrefetchIndexCollectionMixin,
+        sample=NodeSpec(
+            "image_collection_sample", "Image Collection Sample", field_kwargs={"description": "image collection"}
+        ),
+        gather=NodeSpec(
+            "image_collection_gather", "Image Collection Gather", field_kwargs={"description": "image collection"}
+        ),
+    ),
+    CollectionTypeSpec(
+        name="Integer",
+        item_cls=int,
+        collection_output=IntegerCollectionOutput,
+        item_output=IntegerOutput,
+        build_item_output=lambda node, context, item, index: IntegerOutput(value=item),
+        linked=NodeSpec(
+            "integer_collection_linked",
+            "Integer Collection Primitive Linked",
+            version="1.0.1",
+            doc="A collection of integer primitive values",
+            field_kwargs={"default": 0, "description": "The integer value"},
+        ),
+        linked_base=IntegerCollectionInvocation,
+        index=NodeSpec(
+            "integer_collection_index",
+            "Integer Collection Index",
+            version="1.0.1",
+            field_kwargs={"description": "integer collection"},
+        ),
+        sample=NodeSpec(
+            "integer_collection_sample", "Integer Collection Sample", field_kwargs={"description": "integer collection"}
+        ),
+        gather=NodeSpec(
+            "integer_collection_gather", "Integer Collection Gather", field_kwargs={"description": "integer collection"}
+        ),
+    ),
+    CollectionTypeSpec(
+        name="Latents",
+        item_cls=LatentsField,
+        collection_output=LatentsCollectionOutput,
+        item_output=LatentsOutput,
+        build_item_output=_latents_item_output,
+        linked=NodeSpec(
+            "latents_collection_linked",
+            "Latents Collection Primitive Linked",
+            version="1.0.1",
+            doc="A collection of latents tensor primitive values",
+            field_name="latents",
+            field_annotation=Optional[LatentsField],
+            field_kwargs={"default": None, "description": "The latents tensor", "input": Input.Connection},
+        ),
+        linked_base=LatentsCollectionInvocation,
+        index=NodeSpec(
+            "latents_collection_index",
+            "Latents Collection Index",
+            version="1.1.0",
+            field_kwargs={"description": "latents collection"},
+        ),
+        index_mixin=PrefetchIndexCollectionMixin,
+        sample=NodeSpec(
+            "latents_collection_sample", "Latents Collection Sample", field_kwargs={"description": "latents collection"}
+        ),
+        gather=NodeSpec(
+            "latents_collection_gather", "Latents Collection Gather", field_kwargs={"description": "latents collection"}
+        ),
+    ),
+    CollectionTypeSpec(
+        name="String",
+        item_cls=str,
+        collection_output=StringCollectionOutput,
+        item_output=StringOutput,
+        build_item_output=lambda node, context, item, index: StringOutput(value=item),
+        linked=NodeSpec(
+            "string_collection_linked",
+            "String Collection Primitive Linked",
+            version="1.0.1",
+            doc="Allows creation of collection and optionally add a collection",
+            field_annotation=Optional[str],
+            field_kwargs={"default": None, "description": "The string value", "ui_component": UIComponent.Textarea},
+        ),
+        linked_base=StringCollectionInvocation,
+        index=NodeSpec(
+            "string_collection_index",
+            "String Collection Index",
+            version="1.0.1",
+            field_kwargs={"description": "string collection"},
+        ),
+        sample=NodeSpec(
+            "string_collection_sample", "String Collection Sample", field_kwargs={"description": "string collection"}
+        ),
+        gather=NodeSpec(
+            "string_collection_gather", "String Collection Gather", field_kwargs={"description": "string collection"}
+        ),
+    ),
+    CollectionTypeSpec(
+        name="FluxConditioning",
+        item_cls=FluxConditioningField,
+        collection_output=FluxConditioningCollectionOutput,
+        item_output=FluxConditioningOutput,
+        build_item_output=lambda node, context, item, index: FluxConditioningOutput(conditioning=item),
+        collection=NodeSpec(
+            "flux_conditioning_collection",
+            "Flux Conditioning Collection Primitive",
+            doc="A collection of flux conditioning tensor primitive values",
+            tags=("flux", "text_encoder", "conditioning", "primitives", "collection"),
+            field_name="conditioning",
+            field_kwargs={"default": [], "description": FieldDescriptions.cond, "title": "FLUX Conditionings"},
+        ),
+        join=NodeSpec(
+            "flux_conditioning_collection_join",
+            "Flux Conditioning Collection join",
+            doc="Join a flux conditioning tensor or collections into a single collection of flux conditioning tensors",
+            tags=("flux", "text_encoder", "conditioning", "collection", "join"),
+            field_name="conditionings",
+            field_kwargs={
+                "description": FieldDescriptions.cond,
+                "title": "FLUX Text Encoder Conditioning or Collection",
+            },
+        ),
+        index=NodeSpec(
+            "flux_conditioning_index",
+            "Flux Conditioning Collection Index",
+            field_kwargs={"default": [], "description": FieldDescriptions.cond, "title": "FLUX Conditionings"},
+        ),
+    ),
+    CollectionTypeSpec(
+        name="FluxControlNet",
+        item_cls=FluxControlNetField,
+        collection_output=FluxControlNetCollectionOutput,
+        item_output=FluxControlNetOutput,
+        build_item_output=lambda node, context, item, index: FluxControlNetOutput(control=item),
+        collection=NodeSpec(
+            "flux_controlnet_collection",
+            "FLUX ControlNet Collection Primitive",
+            doc="A collection of flux controlnet primitive values",
+            tags=("flux", "controlnet", "primitives", "collection"),
+            field_kwargs={"description": "FLUX ControlNets", "title": "FLUX ControlNet Collection"},
+        ),
+        join=NodeSpec(
+            "flux_controlnet_collection_join",
+            "FLUX ControlNet Collection join",
+            doc="Join a flux controlnet tensors or collections into a single collection of flux controlnet tensors",
+            tags=("flux", "controlnet", "collection", "join"),
+            field_name="controlnets",
+            field_kwargs={"description": "FLUX ControlNets", "title": "FLUX ControlNet or Collection"},
+        ),
+        index=NodeSpec(
+            "flux_controlnet_index",
+            "Flux ControlNet Collection Index",
+            field_kwargs={"default": [], "description": "FLUX ControlNet Collection", "title": "FLUX ControlNets"},
+        ),
+    ),
+    CollectionTypeSpec(
+        name="FluxRedux",
+        item_cls=FluxReduxConditioningField,
+        collection_output=FluxReduxCollectionOutput,
+        item_output=FluxReduxOutput,
+        build_item_output=lambda node, context, item, index: FluxReduxOutput(redux_cond=item),
+        collection=NodeSpec(
+            "flux_redux_collection",
+            "FLUX Redux Collection Primitive",
+            doc="A collection of flux redux primitive values",
+            tags=("flux", "redux", "primitives", "collection"),
+            field_kwargs={"description": "FLUX Redux Collection", "title": "FLUX Redux Collection"},
+        ),
+        join=NodeSpec(
+            "flux_redux_collection_join",
+            "FLUX Redux Collection join",
+            doc="Join a flux redux tensor or collections into a single collection of flux redux tensors",
+            tags=("flux", "redux", "collection", "join"),
+            field_name="conditionings",
+            field_kwargs={"description": "FLUX Reduxs", "title": "FLUX Redux or Collection"},
+        ),
+        index=NodeSpec(
+            "flux_redux_index",
+            "Flux Redux Collection Index",
+            field_kwargs={"default": [], "description": FieldDescriptions.cond, "title": "FLUX Redux Collection"},
+        ),
+    ),
+]
+
+# The generated classes are published as module attributes under their usual names (e.g. ImageCollectionIndexInvocation)
+# so 'from .collection_tools import *' and existing imports keep working. IDEs and type checkers cannot see names
+# created this way (an __all__ would not help them either), so look them up in TYPED_COLLECTION_NODES in typed code.
+TYPED_COLLECTION_NODES: dict[str, dict[str, type[BaseInvocation]]] = {}
+for _spec in TYPED_COLLECTION_TYPES:
+    TYPED_COLLECTION_NODES[_spec.name] = build_typed_collection_nodes(_spec)
+    globals().update({node_cls.__name__: node_cls for node_cls in TYPED_COLLECTION_NODES[_spec.name].values()})
+globals().update(TYPED_COLLECTION_OUTPUTS)
 
 
 # ---------------------------------- Collection [Any] manipulation -----------------
@@ -456,7 +1277,7 @@ class CollectionSortOutput(BaseInvocationOutput):
     title="Collection Sort",
     tags=["collection", "sort"],
     category="util",
-    version="1.0.0",
+    version="1.0.1",
     use_cache=False,
 )
 class CollectionSortInvocation(BaseInvocation):
@@ -473,20 +1294,69 @@ class CollectionSortInvocation(BaseInvocation):
     )
 
     def sort_list(self, items: list[Any], reverse: bool = False) -> list[Any]:
-        if all(isinstance(item, (int, float, str, bool)) for item in items):
-            # If all items are of a simple sortable type, use the built-in sort
-            sorted_items = sorted(items, reverse=reverse)
-        elif all(isinstance(item, BaseModel) for item in items):
-            # If all items are Pydantic models, sort based on their JSON representations
-            sorted_items = sorted(items, key=lambda x: json.dumps(x.model_dump(), sort_keys=True), reverse=reverse)
-        else:
-            # Sort based on JSON string representation of items
-            sorted_items = sorted(items, key=lambda x: json.dumps(x, sort_keys=True), reverse=reverse)
-
-        return sorted_items
+        # The item type is detected once: simple types use the built-in comparison, known field models their
+        # name attribute and anything else its JSON representation
+        key = sort_key_for(detect_item_type(items))
+        return sorted(items, key=key, reverse=reverse)
 
     def invoke(self, context: InvocationContext) -> CollectionSortOutput:
-        return CollectionSortOutput(collection=self.sort_list(self.collection, self.reverse))
+        sorted_items = self.sort_list(self.collection, self.reverse)
+        return CollectionSortOutput(collection=sorted_items)
+
+
+@invocation(
+    "collection_argsort",
+    title="Collection Argsort",
+    tags=["collection", "sort", "argsort", "index"],
+    category="util",
+    version="1.0.0",
+    use_cache=False,
+)
+class CollectionArgsortInvocation(BaseInvocation):
+    """CollectionArgsort Outputs the indices that would sort a collection, without sorting it"""
+
+    collection: list[Any] = InputField(
+        description="collection",
+        default=[],
+        ui_type=UIType._Collection,
+    )
+    reverse: bool = InputField(
+        default=False,
+        description="Reverse Sort",
+    )
+
+    def invoke(self, context: InvocationContext) -> IntegerCollectionOutput:
+        return IntegerCollectionOutput(collection=argsort_items(self.collection, self.reverse))
+
+
+@invocation_output("collection_apply_permutation_output")
+class CollectionApplyPermutationOutput(BaseInvocationOutput):
+    """The output of the collection apply permutation node."""
+
+    collection: list[Any] = OutputField(
+        description="The reordered collection", title="Collection", ui_type=UIType._Collection
+    )
+
+
+@invocation(
+    "collection_apply_permutation",
+    title="Collection Apply Permutation",
+    tags=["collection", "sort", "permutation", "reorder"],
+    category="util",
+    version="1.0.0",
+    use_cache=False,
+)
+class CollectionApplyPermutationInvocation(BaseInvocation):
+    """Reorders a collection by a permutation, e.g. from Collection Argsort or Collection Shuffle"""
+
+    collection: list[Any] = InputField(description="The collection to reorder", default=[], ui_type=UIType._Collection)
+    indices: list[int] = InputField(
+        default=[], description="The position in the collection of each output item, one for every item"
+    )
+
+    def invoke(self, context: InvocationContext) -> CollectionApplyPermutationOutput:
+        check_permutation(self.indices, len(self.collection))
+        return CollectionApplyPermutationOutput(collection=gather_items(self.collection, self.indices))
 
 
 @invocation_output("collection_join_output")
@@ -660,207 +1530,245 @@ class CollectionUniqueInvocation(BaseInvocation):
 
     def invoke(self, context: InvocationContext) -> CollectionUniqueOutput:
         """Removes duplicate items from the collection."""
-        seen_representations = set()
+        seen_keys = set()
         unique_items = []
         for item in self.collection:
-            # To handle unhashable types, we create a stable representation.
-            if isinstance(item, BaseModel):
-                representation = json.dumps(item.model_dump(), sort_keys=True)
-            else:
-                try:
-                    # Attempt to hash the item directly if possible (for simple types).
-                    if item not in seen_representations:
-                        unique_items.append(item)
-                        seen_representations.add(item)
-                    continue
-                except TypeError:
-                    # If the item is not hashable (like a dict), serialize it.
-                    representation = json.dumps(item, sort_keys=True, default=str)
-
-            if representation not in seen_representations:
+            key = canonical_key(item)
+            if key not in seen_keys:
                 unique_items.append(item)
-                seen_representations.add(representation)
+                seen_keys.add(key)
 
         return CollectionUniqueOutput(collection=unique_items)
 
 
-# ---------------------------------- Collection type specific manipulation -----------------
-@invocation(
-    "image_collection_index",
-    title="Image Collection Index",
-    tags=["collection", "index"],
-    category="util",
-    version="1.0.1",
-    use_cache=False,
-)
-class ImageCollectionIndexInvocation(IndexCollectionMixin, BaseInvocation):
-    """CollectionIndex Picks an index out of a collection with a random option"""
-
-    collection: list[ImageField] = InputField(description="image collection")
+@invocation_output("collection_shuffle_output")
+class CollectionShuffleOutput(BaseInvocationOutput):
+    """The output of the collection shuffle node."""
 
-    def invoke(self, context: InvocationContext) -> ImageOutput:
-        selected_item = self._get_selected_item()
-        return ImageOutput.build(context.images.get_dto(selected_item.image_name))
+    collection: list[Any] = OutputField(
+        description="The shuffled collection", title="Collection", ui_type=UIType._Collection
+    )
+    indices: list[int] = OutputField(
+        description="The position in the input collection of each shuffled item", title="Indices"
+    )
 
 
 @invocation(
-    "string_collection_index",
-    title="String Collection Index",
-    tags=["collection", "index"],
+    "collection_shuffle",
+    title="Collection Shuffle",
+    tags=["collection", "shuffle", "random"],
     category="util",
-    version="1.0.1",
+    version="1.0.0",
     use_cache=False,
 )
-class StringCollectionIndexInvocation(IndexCollectionMixin, BaseInvocation):
-    """CollectionIndex Picks an index out of a collection with a random option"""
+class CollectionShuffleInvocation(BaseInvocation):
+    """Shuffles a collection with a seeded Fisher-Yates shuffle."""
 
-    collection: list[str] = InputField(description="string collection")
+    collection: list[Any] = InputField(description="The collection to shuffle", default=[], ui_type=UIType._Collection)
+    seed: Optional[int] = InputField(default=None, ge=0, description="Seed for the shuffle, random if not set")
 
-    def invoke(self, context: InvocationContext) -> StringOutput:
-        selected_item = self._get_selected_item()
-        return StringOutput(value=selected_item)
+    def invoke(self, context: InvocationContext) -> CollectionShuffleOutput:
+        """Shuffles the collection."""
+        indices = list(range(len(self.collection)))
+        rng = random.Random(self.seed) if self.seed is not None else random
+        rng.shuffle(indices)
+        return CollectionShuffleOutput(collection=[self.collection[i] for i in indices], indices=indices)
 
 
 @invocation(
-    "integer_collection_index",
-    title="Integer Collection Index",
-    tags=["collection", "index"],
+    "collection_permutation_index",
+    title="Collection Permutation Index",
+    tags=["collection", "shuffle", "random", "index"],
     category="util",
-    version="1.0.1",
+    version="1.0.0",
     use_cache=False,
 )
-class IntegerCollectionIndexInvocation(IndexCollectionMixin, BaseInvocation):
-    """CollectionIndex Picks an index out of a collection with a random option"""
+class CollectionPermutationIndexInvocation(BaseInvocation):
+    """Picks the index-th item of a seeded random permutation of a collection without shuffling it.
 
-    collection: list[int] = InputField(
-        description="integer collection",
-    )
+    Walking index 0..total-1 (e.g. from an iterate node) with a fixed seed visits every item once in random order
+    using constant memory. Without a seed every run uses a new permutation, so it is the same as a random pick.
+    """
 
-    def invoke(self, context: InvocationContext) -> IntegerOutput:
-        selected_item = self._get_selected_item()
-        return IntegerOutput(value=selected_item)
+    collection: list[Any] = InputField(
+        description="The collection to pick from, leave empty to only output the permuted index",
+        default=[],
+        ui_type=UIType._Collection,
+    )
+    total: int = InputField(default=0, ge=0, description="The size of the permutation when no collection is connected")
+    index: int = InputField(
+        default=0, ge=0, description="zero based position in the permutation (note index will wrap around)"
+    )
+    seed: Optional[int] = InputField(
+        default=None,
+        ge=0,
+        le=_MASK64,
+        description="Seed for the permutation (set it to walk one permutation across runs), random if not set",
+    )
 
+    def invoke(self, context: InvocationContext) -> CollectionIndexOutput:
+        total = len(self.collection) or self.total
+        if total == 0:
+            raise ValueError("Input collection is empty and total is 0.")
+        seed = self.seed if self.seed is not None else random.getrandbits(64)
+        selected_index = permutation_index(self.index, total, seed)
+        selected_item = self.collection[selected_index] if self.collection else None
+        return CollectionIndexOutput(item=selected_item, index=selected_index, total=total)
 
-@invocation(
-    "float_collection_index",
-    title="Float Collection Index",
-    tags=["collection", "index"],
-    category="util",
-    version="1.1.1",
-    use_cache=False,
-)
-class FloatCollectionIndexInvocation(IndexCollectionMixin, BaseInvocation):
-    """CollectionIndex Picks an index out of a collection with a random option"""
 
-    collection: list[float] = InputField(description="float collection")
+@invocation_output("collection_gather_output")
+class CollectionGatherOutput(BaseInvocationOutput):
+    """The output of the collection gather node."""
 
-    def invoke(self, context: InvocationContext) -> FloatOutput:
-        selected_item = self._get_selected_item()
-        return FloatOutput(value=selected_item)
+    collection: list[Any] = OutputField(
+        description="The gathered items", title="Collection", ui_type=UIType._Collection
+    )
+    indices: list[int] = OutputField(description="The resolved index of each item", title="Indices")
 
 
 @invocation(
-    "bool_collection_index",
-    title="Bool Collection Index",
-    tags=["collection", "index"],
+    "collection_gather",
+    title="Collection Gather",
+    tags=["collection", "gather", "index"],
     category="util",
-    version="1.0.1",
+    version="1.0.0",
     use_cache=False,
 )
-class BoolCollectionIndexInvocation(IndexCollectionMixin, BaseInvocation):
-    """CollectionIndex Picks an index out of a collection with a random option"""
-
-    collection: list[bool] = InputField(description="bool collection")
+class CollectionGatherInvocation(BaseInvocation):
+    """CollectionGather Picks the items at many indices out of a collection in one pass"""
 
-    def invoke(self, context: InvocationContext) -> BooleanOutput:
-        selected_item = self._get_selected_item()
-        return BooleanOutput(value=selected_item)
+    collection: list[Any] = InputField(description="collection", default=[], ui_type=UIType._Collection)
+    indices: list[int] = InputField(default=[], description="The indices of the items to pick")
+    policy: GATHER_POLICIES = InputField(default="wrap", description="How to handle out of range indices")
 
+    def invoke(self, context: InvocationContext) -> CollectionGatherOutput:
+        positions = resolve_indices(self.indices, len(self.collection), self.policy)
+        return CollectionGatherOutput(collection=gather_items(self.collection, positions), indices=positions)
 
-@invocation(
-    "latents_collection_index",
-    title="Latents Collection Index",
-    tags=["collection", "index"],
-    category="util",
-    version="1.0.0",
-    use_cache=False,
-)
-class LatentsCollectionIndexInvocation(IndexCollectionMixin, BaseInvocation):
-    """CollectionIndex Picks an index out of a collection with a random option"""
 
-    collection: list[LatentsField] = InputField(description="latents collection")
+@invocation_output("collection_group_output")
+class CollectionGroupOutput(BaseInvocationOutput):
+    """The output of the collection group node."""
 
-    def invoke(self, context: InvocationContext) -> LatentsOutput:
-        selected_item = self._get_selected_item()
-
-        return LatentsOutput.build(
-            latents_name=selected_item.latents_name,
-            latents=context.tensors.load(selected_item.latents_name),
-            seed=selected_item.seed,
-        )
+    keys: list[Any] = OutputField(description="The distinct keys", title="Keys", ui_type=UIType._Collection)
+    counts: list[int] = OutputField(description="The number of items with each key", title="Counts")
+    groups: list[list[Any]] = OutputField(
+        description="The items grouped by key, one collection per key", title="Groups", ui_type=UIType._Collection
+    )
 
 
 @invocation(
-    "flux_conditioning_index",
-    title="Flux Conditioning Collection Index",
-    tags=["collection", "index"],
+    "collection_group",
+    title="Collection Group/Histogram",
+    tags=["collection", "group", "histogram", "count"],
     category="util",
     version="1.0.0",
     use_cache=False,
 )
-class FluxConditioningCollectionIndexInvocation(IndexCollectionMixin, BaseInvocation):
-    """CollectionIndex Picks an index out of a collection with a random option"""
+class CollectionGroupInvocation(BaseInvocation):
+    """Groups the items of a collection by key and counts how many items have each key."""
 
-    collection: list[FluxConditioningField] = InputField(
-        default=[],
-        description=FieldDescriptions.cond,
-        title="FLUX Conditionings",
+    collection: list[Any] = InputField(description="The collection to group", default=[], ui_type=UIType._Collection)
+    key_path: str = InputField(
+        default="", description="Dotted path to the key on each item (e.g. lora.key), empty groups by the item itself"
+    )
+    sort_by_count: bool = InputField(
+        default=False, description="Order the groups by descending count instead of first appearance"
     )
 
-    def invoke(self, context: InvocationContext) -> FluxConditioningOutput:
-        selected_item = self._get_selected_item()
-        return FluxConditioningOutput(conditioning=selected_item)
+    def invoke(self, context: InvocationContext) -> CollectionGroupOutput:
+        """Groups the collection in a single hashing pass."""
+        get_key = compile_key_path(self.key_path)
+        slots: dict[Any, int] = {}
+        keys: list[Any] = []
+        groups: list[list[Any]] = []
+        for item in self.collection:
+            key = get_key(item)
+            if key is _MISSING:
+                key = None
+            hashable_key = canonical_key(key)
+            slot = slots.get(hashable_key)
+            if slot is None:
+                slots[hashable_key] = len(keys)
+                keys.append(key)
+                groups.append([item])
+            else:
+                groups[slot].append(item)
 
+        counts = [len(group) for group in groups]
+        if self.sort_by_count:
+            order = sorted(range(len(keys)), key=counts.__getitem__, reverse=True)
+            keys = [keys[i] for i in order]
+            counts = [counts[i] for i in order]
+            groups = [groups[i] for i in order]
 
-@invocation(
-    "flux_controlnet_index",
-    title="Flux ControlNet Collection Index",
-    tags=["collection", "index"],
-    category="util",
-    version="1.0.0",
-    use_cache=False,
-)
-class FluxControlNetCollectionIndexInvocation(IndexCollectionMixin, BaseInvocation):
-    """CollectionIndex Picks an index out of a collection with a random option"""
+        return CollectionGroupOutput(keys=keys, counts=counts, groups=groups)
 
-    collection: list[FluxControlNetField] = InputField(
-        default=[],
-        description="FLUX ControlNet Collection",
-        title="FLUX ControlNets",
-    )
 
-    def invoke(self, context: InvocationContext) -> FluxControlNetOutput:
-        selected_item = self._get_selected_item()
-        return FluxControlNetOutput(control=selected_item)
+@invocation_output("collection_filter_output")
+class CollectionFilterOutput(BaseInvocationOutput):
+    """The output of the collection filter node."""
+
+    collection: list[Any] = OutputField(
+        description="The filtered collection", title="Collection", ui_type=UIType._Collection
+    )
+    indices: list[int] = OutputField(
+        description="The indices of the kept items in the input collection", title="Indices"
+    )
 
 
 @invocation(
-    "flux_redux_index",
-    title="Flux Redux Collection Index",
-    tags=["collection", "index"],
+    "collection_filter",
+    title="Collection Filter",
+    tags=["collection", "filter"],
     category="util",
     version="1.0.0",
     use_cache=False,
 )
-class FluxReduxCollectionIndexInvocation(IndexCollectionMixin, BaseInvocation):
-    """CollectionIndex Picks an index out of a collection with a random option"""
-
-    collection: list[FluxReduxConditioningField] = InputField(
-        default=[],
-        description=FieldDescriptions.cond,
-        title="FLUX Redux Collection",
+class CollectionFilterInvocation(BaseInvocation):
+    """Filters a collection, keeping the items that match a predicate."""
+
+    collection: list[Any] = InputField(description="The collection to filter", default=[], ui_type=UIType._Collection)
+    predicate: FILTER_PREDICATES = InputField(default="equals", description="The test applied to each item")
+    value: str = InputField(default="", description="The value for equals/not_equals or the pattern for regex")
+    min_value: Optional[float] = InputField(default=None, description="The inclusive lower bound for range")
+    max_value: Optional[float] = InputField(default=None, description="The inclusive upper bound for range")
+    key_path: str = InputField(
+        default="", description="Dotted path to the value tested on each item (e.g. image_name or lora.key)"
     )
+    invert: bool = InputField(default=False, description="Keep the items that do not match")
+
+    def _numeric_mask(self) -> Optional[np.ndarray]:
+        """Vectorized predicate for plain numeric collections, returns None if it does not apply."""
+        if self.key_path or self.predicate == "regex":
+            return None
+        values = _numeric_array(self.collection)
+        if values is None:
+            return None
+        if self.predicate == "range":
+            low = -math.inf if self.min_value is None else self.min_value
+            high = math.inf if self.max_value is None else self.max_value
+            return (values >= low) & (values <= high)
+        target = _parse_number(self.value)
+        if target is _MISSING:
+            # like the scalar path, a non-numeric value equals no number
+            return np.full(len(values), self.predicate == "not_equals")
+        if isinstance(target, int) and abs(target) > _FLOAT_EXACT_INT:
+            return None
+        mask = values == target
+        return ~mask if self.predicate == "not_equals" else mask
+
+    def invoke(self, context: InvocationContext) -> CollectionFilterOutput:
+        """Filters the collection in a single pass."""
+        mask = self._numeric_mask()
+        if mask is not None:
+            if self.invert:
+                mask = ~mask
+            indices = np.flatnonzero(mask).tolist()
+        else:
+            get_value = compile_key_path(self.key_path)
+            test = compile_predicate(self.predicate, self.value, self.min_value, self.max_value)
+            invert = self.invert
+            indices = [i for i, item in enumerate(self.collection) if test(get_value(item)) != invert]
 
-    def invoke(self, context: InvocationContext) -> FluxReduxOutput:
-        selected_item = self._get_selected_item()
-        return FluxReduxOutput(redux_cond=selected_item)
+        return CollectionFilterOutput(collection=[self.collection[i] for i in indices], indices=indices)